@@ -0,0 +1,61 @@
+"""
+JSON serialization helpers for the engine hot paths.
+
+Dispatches to orjson (Rust, several times faster than stdlib json on the
+small dicts audit entries are made of) when it is installed, and falls
+back to a compact stdlib encoder otherwise. orjson is an optional
+dependency: pip install agenttrace[perf].
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import types
+import uuid
+from typing import Any
+
+
+def _default(obj: Any) -> Any:
+    """Convert the non-JSON types audit details actually contain.
+
+    Explicit isinstance checks instead of a blanket str() fallback, so
+    genuinely unserializable objects still fail loudly rather than
+    producing a useless repr in the audit trail.
+    """
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, types.MappingProxyType):
+        # Shared read-only detail payloads (see record_violation)
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+except ImportError:
+    HAS_ORJSON = False
+
+    _encode = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode
+
+    def dumps(obj: Any) -> str:
+        return _encode(obj)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return _encode(obj).encode()
@@ -27,14 +27,22 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Mapping
 
 from agenttrace.engine.audit_logger import AuditLogger
 from agenttrace.engine.cost_tracker import CostTracker
 from agenttrace.engine.kill_switch import KillSwitch, KillEvent
-from agenttrace.engine.policy_engine import PolicyAction, PolicyDecision, PolicyEngine
+from agenttrace.engine.policy_engine import (
+    ALLOWED_DECISION,
+    PolicyAction,
+    PolicyDecision,
+    PolicyEngine,
+)
 from agenttrace.engine.session import (
     ActionRecord,
     Session,
@@ -47,6 +55,19 @@ import time
 logger = logging.getLogger("agenttrace")
 
 
+@dataclass(slots=True)
+class ActionContext:
+    """Mutable view handed out by AgentTrace.action().
+
+    Set actual_cost or output_tokens inside the block; post_action is
+    called with them on exit (when the action was allowed).
+    """
+    decision: PolicyDecision
+    actual_cost: float = 0.0
+    output_tokens: int | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
 class AgentTrace:
     """
     Top-level API for session-aware policy enforcement.
@@ -66,6 +87,10 @@ class AgentTrace:
         self.session_manager = SessionManager()
         self.cost_tracker = CostTracker()
         self.audit = AuditLogger(file_path=audit_log_path)
+        # Token counts computed during pre_action, keyed by
+        # (session_id, action_name), consumed by the matching post_action
+        # so the same input text isn't tokenized twice.
+        self._pending_input_tokens: dict[tuple[str, str], int] = {}
 
         # Build kill switch from policy
         ks_policy = policy_engine.policy.kill_switch
@@ -126,13 +151,14 @@ class AgentTrace:
         action_name: str,
         estimated_cost: float = 0.0,
         model: str | None = None,
-        input_text: str | None = None,
+        input_text: str | list[str] | None = None,
     ) -> PolicyDecision:
         """
         Check policy BEFORE an action executes.
 
         If model + input_text are provided, estimates cost via tiktoken.
-        Otherwise uses the provided estimated_cost.
+        input_text may be a list of prompts, which is tokenized in one
+        batch call. Otherwise uses the provided estimated_cost.
 
         Returns a PolicyDecision. If action_allowed is False, the caller
         should not proceed with the action.
@@ -140,11 +166,19 @@ class AgentTrace:
         session = self._get_active_session(session_id)
 
         # Estimate cost if we have text
+        input_token_count: int | None = None
         if model and input_text and estimated_cost == 0.0:
-            estimate = self.cost_tracker.estimate_cost(
-                model=model, input_text=input_text
-            )
+            if isinstance(input_text, str):
+                estimate = self.cost_tracker.estimate_cost(
+                    model=model, input_text=input_text
+                )
+            else:
+                counts = self.cost_tracker.count_tokens_batch(input_text, model)
+                estimate = self.cost_tracker.estimate_cost(
+                    model=model, input_tokens=sum(counts), output_tokens=0
+                )
             estimated_cost = estimate.total_cost
+            input_token_count = estimate.input_tokens
 
         # Evaluate against policy
         decision = self.policy_engine.evaluate_pre_action(
@@ -155,6 +189,18 @@ class AgentTrace:
             action_name=action_name,
         )
 
+        # Stash the pre-action token count so post_action can reuse it
+        # (the shared ALLOWED_DECISION must never be mutated, so the
+        # count always travels through the pending map too)
+        if input_token_count is not None and decision.action_allowed:
+            self._pending_input_tokens[(session_id, action_name)] = input_token_count
+            if decision is not ALLOWED_DECISION:
+                decision.input_tokens = input_token_count
+
+        # Steady-state path: one identity check, nothing to act on
+        if decision is ALLOWED_DECISION:
+            return decision
+
         # Act on the decision
         if not decision.action_allowed:
             self.audit.log_action_blocked(
@@ -164,9 +210,9 @@ class AgentTrace:
                 reason=decision.reason,
                 session_total_cost=session.total_cost,
             )
-            if decision.action_taken == PolicyAction.KILL:
+            if decision.action_taken is PolicyAction.KILL:
                 self._execute_kill(session, decision.reason)
-        elif decision.action_taken == PolicyAction.ALERT:
+        elif decision.action_taken is PolicyAction.ALERT:
             session.set_alert()
             self.audit.log(
                 "budget_alert",
@@ -195,18 +241,33 @@ class AgentTrace:
         """
         session = self._get_active_session(session_id)
 
-        # Calculate actual cost if tokens provided
-        if model and (input_tokens or output_tokens):
-            estimate = self.cost_tracker.estimate_cost(
-                model=model,
-                input_tokens=input_tokens or 0,
-                output_tokens=output_tokens or 0,
-            )
-            actual_cost = estimate.total_cost
+        # Consume whatever token count pre_action stashed for this
+        # action. Popped unconditionally so a stash this call doesn't
+        # use can never linger and reprice a later, unrelated action
+        # with the same name.
+        pending_tokens = self._pending_input_tokens.pop(
+            (session_id, action_name), None
+        )
+
+        # An explicitly supplied cost always wins; tokens only price the
+        # action when the caller didn't pass one (mirroring pre_action's
+        # estimated_cost == 0.0 gate).
+        if actual_cost == 0.0 and model:
+            # Reuse the token count pre_action already computed for this
+            # action's input text instead of tokenizing it again
+            if input_tokens is None:
+                input_tokens = pending_tokens
+            if input_tokens or output_tokens:
+                estimate = self.cost_tracker.estimate_cost(
+                    model=model,
+                    input_tokens=input_tokens or 0,
+                    output_tokens=output_tokens or 0,
+                )
+                actual_cost = estimate.total_cost
 
         record = ActionRecord(
             action_name=action_name,
-            timestamp=time.time(),
+            timestamp=time.time_ns(),
             cost=actual_cost,
             metadata=metadata or {},
         )
@@ -220,13 +281,131 @@ class AgentTrace:
             session_total_cost=session.total_cost,
         )
 
+    # ── Combined pre/post fast path ───────────────────────────────
+
+    def record_action(
+        self,
+        session_id: str,
+        action_name: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int = 0,
+        metadata: dict[str, Any] | None = None,
+    ) -> PolicyDecision:
+        """
+        Admit and record an action in one call.
+
+        For callers that already know actual token usage (non-streaming
+        LLM responses), this does the work of pre_action + post_action
+        with a single session lookup, one cost estimate, and one audit
+        entry instead of two. Use pre_action/post_action when tokens
+        are unknown until the action completes.
+
+        Returns the PolicyDecision; the action is only recorded when it
+        was allowed.
+        """
+        session = self._get_active_session(session_id)
+
+        estimate = self.cost_tracker.estimate_cost(
+            model=model, input_tokens=input_tokens, output_tokens=output_tokens
+        )
+        cost = estimate.total_cost
+
+        decision = self.policy_engine.evaluate_pre_action(
+            session_total_cost=session.total_cost,
+            session_action_count=session.action_count,
+            session_duration=session.duration,
+            estimated_cost=cost,
+            action_name=action_name,
+        )
+
+        if not decision.action_allowed:
+            self.audit.log_action_blocked(
+                session_id=session.session_id,
+                agent_id=session.agent_id,
+                action_name=action_name,
+                reason=decision.reason,
+                session_total_cost=session.total_cost,
+            )
+            if decision.action_taken is PolicyAction.KILL:
+                self._execute_kill(session, decision.reason)
+            return decision
+
+        if decision is not ALLOWED_DECISION and decision.action_taken is PolicyAction.ALERT:
+            session.set_alert()
+            self.audit.log(
+                "budget_alert",
+                session_id=session.session_id,
+                agent_id=session.agent_id,
+                reason=decision.reason,
+            )
+
+        record = ActionRecord(
+            action_name=action_name,
+            timestamp=time.time_ns(),
+            cost=cost,
+            metadata=metadata or {},
+        )
+        session.record_action(record)
+
+        self.audit.log_action_allowed(
+            session_id=session.session_id,
+            agent_id=session.agent_id,
+            action_name=action_name,
+            cost=cost,
+            session_total_cost=session.total_cost,
+        )
+        return decision
+
+    # ── Combined pre/post convenience ─────────────────────────────
+
+    @contextlib.contextmanager
+    def action(
+        self,
+        session_id: str,
+        action_name: str,
+        estimated_cost: float = 0.0,
+        model: str | None = None,
+        input_text: str | list[str] | None = None,
+    ) -> Iterator[ActionContext]:
+        """
+        Run pre_action and post_action around a block of work.
+
+        The input token count from the pre-action estimate is shared
+        with post_action automatically, so the text is tokenized once.
+
+        Usage:
+            with trace.action(sid, "llm_call", model=m, input_text=prompt) as ctx:
+                if ctx.decision.action_allowed:
+                    response = call_llm(prompt)
+                    ctx.output_tokens = response.usage.output_tokens
+        """
+        decision = self.pre_action(
+            session_id,
+            action_name,
+            estimated_cost=estimated_cost,
+            model=model,
+            input_text=input_text,
+        )
+        ctx = ActionContext(decision=decision)
+        yield ctx
+        if decision.action_allowed:
+            self.post_action(
+                session_id,
+                action_name,
+                actual_cost=ctx.actual_cost,
+                model=model,
+                output_tokens=ctx.output_tokens,
+                metadata=ctx.metadata or None,
+            )
+
     # ── Violation recording ───────────────────────────────────────
 
     def record_violation(
         self,
         session_id: str,
         violation_type: str,
-        details: dict[str, Any] | None = None,
+        details: Mapping[str, Any] | None = None,
     ) -> PolicyDecision:
         """
         Record a violation detected by an external scanner.
@@ -241,13 +420,16 @@ class AgentTrace:
             decision = trace.record_violation(session_id, "pii_blocked")
             # AgentTrace checks: is this the 3rd PII block? → kill
         """
+        # Interned once here; every lookup below (session counter,
+        # threshold map, engine evaluation) then compares by identity
+        violation_type = sys.intern(violation_type)
         session = self._get_active_session(session_id)
 
         # Record and get cumulative count
         count = session.record_violation(violation_type, details)
 
-        # Get threshold for this violation type
-        threshold_config = self.policy.get_violation_threshold(violation_type)
+        # Get threshold for this violation type (O(1) engine map)
+        threshold_config = self.policy_engine.get_violation_threshold(violation_type)
         threshold_val = threshold_config.max_count if threshold_config else None
 
         self.audit.log_violation(
@@ -264,7 +446,7 @@ class AgentTrace:
             cumulative_count=count,
         )
 
-        if not decision.action_allowed and decision.action_taken == PolicyAction.KILL:
+        if not decision.action_allowed and decision.action_taken is PolicyAction.KILL:
             self._execute_kill(session, decision.reason)
 
         return decision
@@ -272,8 +454,14 @@ class AgentTrace:
     # ── Kill execution ────────────────────────────────────────────
 
     def _execute_kill(self, session: Session, reason: str) -> KillEvent:
-        """Execute the kill switch on a session."""
-        event = self.kill_switch.execute_sync(session, reason)
+        """Execute the kill switch on a session.
+
+        Non-blocking: the session is dead before this returns, but the
+        webhook fanout runs on the background loop so a slow Slack
+        endpoint can't stall the enforcement path.
+        """
+        event = self.kill_switch.execute_nowait(session, reason)
+        self._drop_pending_tokens(session.session_id)
         self.audit.log_session_killed(
             session_id=session.session_id,
             agent_id=session.agent_id,
@@ -289,19 +477,37 @@ class AgentTrace:
         """Gracefully complete a session and return audit summary."""
         session = self._get_active_session(session_id)
         session.complete()
+        self._drop_pending_tokens(session_id)
         self.audit.log(
             "session_completed",
             session_id=session.session_id,
             agent_id=session.agent_id,
-            total_cost=round(session.total_cost, 6),
+            total_cost=session.total_cost,
             action_count=session.action_count,
-            violation_counts=session.violation_counts,
-            duration_seconds=round(session.duration, 2),
+            violation_counts=dict(session.violation_counts),
+            duration_seconds=session.duration,
         )
         return session.to_audit_dict()
 
+    # ── Shutdown ──────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Flush pending audit writes and close the audit file.
+
+        Also registered via the audit logger's atexit hook, so calling
+        this explicitly is only needed for deterministic shutdown.
+        """
+        self.kill_switch.drain()
+        self.audit.close()
+
     # ── Helpers ───────────────────────────────────────────────────
 
+    def _drop_pending_tokens(self, session_id: str) -> None:
+        """Forget stashed pre-action token counts for a terminal session."""
+        pending = self._pending_input_tokens
+        for key in [k for k in pending if k[0] == session_id]:
+            del pending[key]
+
     def _get_active_session(self, session_id: str) -> Session:
         session = self.session_manager.get_session(session_id)
         if session is None:
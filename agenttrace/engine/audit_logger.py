@@ -9,24 +9,42 @@ Supports JSON Lines file output and is structured for OTel export.
 
 from __future__ import annotations
 
-import json
+import atexit
+import collections
 import logging
+import os
+import queue
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from agenttrace.engine import _json as _jsonlib
+
 logger = logging.getLogger("agenttrace.audit")
 
+# How many queued entries the writer thread drains per write batch.
+_MAX_WRITE_BATCH = 128
+
+# os.writev accepts at most IOV_MAX buffers per call (1024 on Linux).
+try:
+    _IOV_MAX = min(os.sysconf("SC_IOV_MAX"), 1024)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+_HAS_WRITEV = hasattr(os, "writev")
 
-@dataclass
+
+@dataclass(slots=True)
 class AuditEntry:
     """A single audit log entry."""
-    timestamp: float
+    timestamp: int  # epoch nanoseconds (time.time_ns)
     event_type: str  # action_allowed, action_blocked, violation, session_killed, session_created
     session_id: str
     agent_id: str
     details: dict[str, Any] = field(default_factory=dict)
+    _json: str | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -38,7 +56,10 @@ class AuditEntry:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), default=str)
+        # Entries are immutable once logged, so serialize at most once
+        if self._json is None:
+            self._json = _jsonlib.dumps(self.to_dict())
+        return self._json
 
 
 class AuditLogger:
@@ -46,18 +67,43 @@ class AuditLogger:
     Immutable audit log for all AgentTrace events.
 
     Writes to:
-    - In-memory buffer (always)
+    - In-memory ring buffer (always, bounded)
     - JSON Lines file (if configured)
     - Python logger (always)
 
-    Production would add OTel span export here.
+    The in-memory buffer keeps the most recent max_in_memory_entries
+    events; the JSONL file is the durable full history. Production would
+    add OTel span export here.
     """
 
-    def __init__(self, file_path: str | None = None):
-        self._entries: list[AuditEntry] = []
+    def __init__(self, file_path: str | None = None, max_in_memory_entries: int = 10_000):
+        self._entries: collections.deque[AuditEntry] = collections.deque(
+            maxlen=max_in_memory_entries
+        )
+        # Per-session view of the same ring. Unbounded deques: _emit
+        # evicts from here in lockstep with the ring, so total retention
+        # is capped by max_in_memory_entries, not per session.
+        self._by_session: dict[str, collections.deque[AuditEntry]] = collections.defaultdict(
+            collections.deque
+        )
+        # Guards the ring + per-session index so concurrent log() calls
+        # can't double-evict the same oldest entry (deque.append alone
+        # is GIL-atomic; the evict-then-append pair is not).
+        self._ring_lock = threading.Lock()
         self._file_path = file_path
+        self._fh = None
+        self._q: queue.Queue[bytes | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
         if file_path:
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            # buffering=0 so the writer thread's batching is the only
+            # buffering layer
+            self._fh = open(file_path, "ab", buffering=0)
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="agenttrace-audit-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
 
     def log(
         self,
@@ -68,23 +114,96 @@ class AuditLogger:
     ) -> AuditEntry:
         """Record an audit entry."""
         entry = AuditEntry(
-            timestamp=time.time(),
+            timestamp=time.time_ns(),
             event_type=event_type,
             session_id=session_id,
             agent_id=agent_id,
             details=details,
         )
-        self._entries.append(entry)
+        self._emit(entry)
+        return entry
 
-        # Write to file
-        if self._file_path:
-            with open(self._file_path, "a") as f:
-                f.write(entry.to_json() + "\n")
+    def _emit(self, entry: AuditEntry) -> None:
+        """Store, buffer-write, and log a prebuilt entry."""
+        entries = self._entries
+        with self._ring_lock:
+            if len(entries) == entries.maxlen:
+                # The ring is about to drop its oldest entry; drop it from
+                # the per-session index too, and the session key once empty,
+                # so dead sessions can't pin aged-out entries forever.
+                evicted = entries[0]
+                session_view = self._by_session[evicted.session_id]
+                session_view.popleft()
+                if not session_view:
+                    del self._by_session[evicted.session_id]
+            entries.append(entry)
+            self._by_session[entry.session_id].append(entry)
 
-        # Python logging
-        logger.info(f"[{event_type}] session={session_id[:12]} agent={agent_id} {details}")
+        # Hand the file write to the background writer thread; the caller
+        # only pays for an enqueue
+        if self._fh is not None:
+            self._q.put(entry.to_json().encode() + b"\n")
 
-        return entry
+        # Python logging — lazy %s formatting so a disabled level skips
+        # the repr of the details dict entirely
+        logger.info(
+            "[%s] session=%s agent=%s %s",
+            entry.event_type, entry.session_id[:12], entry.agent_id, entry.details,
+        )
+
+    def _writer_loop(self) -> None:
+        """Drain queued entries in batches and write each batch at once."""
+        while True:
+            item = self._q.get()
+            stop = item is None
+            batch: list[bytes] = [] if stop else [item]
+            # Opportunistically drain whatever else is already queued
+            while not stop and len(batch) < _MAX_WRITE_BATCH:
+                try:
+                    nxt = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                else:
+                    batch.append(nxt)
+            try:
+                self._write_batch(batch)
+            except OSError as e:  # pragma: no cover - disk errors
+                logger.error("Audit file write failed: %s", e)
+            finally:
+                # One task_done per dequeued item (incl. the sentinel)
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._q.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        if not batch or self._fh is None:
+            return
+        if _HAS_WRITEV:
+            fd = self._fh.fileno()
+            for i in range(0, len(batch), _IOV_MAX):
+                os.writev(fd, batch[i:i + _IOV_MAX])
+        else:
+            self._fh.write(b"".join(batch))
+
+    def flush(self) -> None:
+        """Block until every logged entry has been written to the file."""
+        if self._writer is None:
+            return
+        self._q.join()
+
+    def close(self) -> None:
+        """Flush, stop the writer thread, and close the audit file."""
+        if self._fh is None:
+            return
+        if self._writer is not None:
+            self._q.put(None)
+            self._writer.join()
+            self._writer = None
+        self._fh.close()
+        self._fh = None
 
     def log_action_allowed(
         self,
@@ -94,14 +213,22 @@ class AuditLogger:
         cost: float,
         session_total_cost: float,
     ) -> AuditEntry:
-        return self.log(
-            "action_allowed",
+        # The hottest audit path (every successful action): build the
+        # entry inline rather than paying two dict builds + kwargs
+        # unpacking through the variadic log().
+        entry = AuditEntry(
+            timestamp=time.time_ns(),
+            event_type="action_allowed",
             session_id=session_id,
             agent_id=agent_id,
-            action=action_name,
-            cost_usd=round(cost, 6),
-            session_total_cost_usd=round(session_total_cost, 6),
+            details={
+                "action": action_name,
+                "cost_usd": cost,
+                "session_total_cost_usd": session_total_cost,
+            },
         )
+        self._emit(entry)
+        return entry
 
     def log_action_blocked(
         self,
@@ -117,7 +244,7 @@ class AuditLogger:
             agent_id=agent_id,
             action=action_name,
             reason=reason,
-            session_total_cost_usd=round(session_total_cost, 6),
+            session_total_cost_usd=session_total_cost,
         )
 
     def log_violation(
@@ -150,7 +277,7 @@ class AuditLogger:
             session_id=session_id,
             agent_id=agent_id,
             reason=reason,
-            total_cost_usd=round(total_cost, 6),
+            total_cost_usd=total_cost,
             action_count=action_count,
         )
 
@@ -158,9 +285,27 @@ class AuditLogger:
     def entries(self) -> list[AuditEntry]:
         return list(self._entries)
 
+    def iter_entries(self):
+        """Iterate entries without materializing a list copy.
+
+        Suited to iteration-heavy consumers (dashboards, exporters)
+        walking tens of thousands of records. Iterating concurrently
+        with new log() calls raises RuntimeError (deque semantics) —
+        use the entries property for a stable snapshot in that case.
+        """
+        return iter(self._entries)
+
     def entries_for_session(self, session_id: str) -> list[AuditEntry]:
-        return [e for e in self._entries if e.session_id == session_id]
+        return list(self._by_session.get(session_id, ()))
+
+    def event_types_for_session(self, session_id: str) -> frozenset[str]:
+        """Distinct event types logged for a session, in one pass."""
+        return frozenset(
+            e.event_type for e in self._by_session.get(session_id, ())
+        )
 
     def export_json(self) -> str:
         """Export all entries as a JSON array."""
-        return json.dumps([e.to_dict() for e in self._entries], indent=2, default=str)
+        # Join the per-entry cached strings instead of rebuilding N dicts
+        # and reserializing them through one big json.dumps call.
+        return "[" + ",\n".join(e.to_json() for e in self._entries) + "]"
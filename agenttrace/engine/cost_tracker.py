@@ -11,8 +11,11 @@ with the Session to enforce budget limits before actions execute.
 
 from __future__ import annotations
 
+import functools
+import os
+import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
 import tiktoken
 
@@ -57,9 +60,51 @@ MODEL_ENCODINGS: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _ModelInfo:
+    """Everything the hot path needs about a model, in one lookup."""
+    in_rate: float   # USD per input token
+    out_rate: float  # USD per output token
+    encoding_name: str
+
+
+# Pricing and encoding flattened into a single table at import time so
+# estimate_cost does one dict lookup and two multiplies instead of
+# per-call divisions and a second lookup chain. Keys are interned so
+# lookups with literal model names hit the identity fast-path.
+_MODEL_INFO: dict[str, _ModelInfo] = {
+    sys.intern(model): _ModelInfo(
+        in_rate=p["input"] * 1e-6,
+        out_rate=p["output"] * 1e-6,
+        encoding_name=MODEL_ENCODINGS.get(model, MODEL_ENCODINGS["default"]),
+    )
+    for model, p in MODEL_PRICING.items()
+}
+_DEFAULT_MODEL_INFO = _MODEL_INFO["default"]
+
+# Agents re-send the same system prompts and few-shot templates over and
+# over; only cache short-ish texts so the cache can't balloon.
+_COUNT_CACHE_MAX_TEXT_LEN = 16384
+
+
+@functools.lru_cache(maxsize=None)
+def _load_encoding(name: str) -> tiktoken.Encoding:
+    """Build a tiktoken encoding once per process, shared across trackers."""
+    return tiktoken.get_encoding(name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_count(encoding_name: str, text: str) -> int:
+    return len(_load_encoding(encoding_name).encode_ordinary(text))
+
+
+@dataclass(slots=True, frozen=True)
 class CostEstimate:
-    """Result of a cost estimation."""
+    """Result of a cost estimation.
+
+    Frozen: estimate_cost may return a shared cached instance, so
+    mutation must raise rather than poison the cache.
+    """
     input_tokens: int
     output_tokens: int
     input_cost: float
@@ -78,7 +123,29 @@ class CostEstimate:
         }
 
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def _cached_estimate(model: str, input_tokens: int, output_tokens: int) -> CostEstimate:
+    """Estimate for an exact (model, in, out) triple, cached.
+
+    Planner and retry loops re-estimate the same triples constantly.
+    The returned instance is shared across callers — safe because
+    CostEstimate is frozen, like ALLOWED_DECISION in the policy engine.
+    The pricing table is fixed at import, so entries never go stale.
+    """
+    info = _MODEL_INFO.get(model) or _DEFAULT_MODEL_INFO
+    input_cost = input_tokens * info.in_rate
+    output_cost = output_tokens * info.out_rate
+    return CostEstimate(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        input_cost=input_cost,
+        output_cost=output_cost,
+        total_cost=input_cost + output_cost,
+        model=model,
+    )
+
+
+@dataclass(slots=True)
 class BudgetDecision:
     """Result of a budget check."""
     allowed: bool
@@ -101,22 +168,76 @@ class CostTracker:
     3. count_tokens(text, model) → int
     """
 
-    def __init__(self):
-        self._encoders: dict[str, tiktoken.Encoding] = {}
+    def _get_model_info(self, model: str) -> _ModelInfo:
+        return _MODEL_INFO.get(model) or _DEFAULT_MODEL_INFO
 
     def _get_encoder(self, model: str) -> tiktoken.Encoding:
-        encoding_name = MODEL_ENCODINGS.get(model, MODEL_ENCODINGS["default"])
-        if encoding_name not in self._encoders:
-            self._encoders[encoding_name] = tiktoken.get_encoding(encoding_name)
-        return self._encoders[encoding_name]
+        return _load_encoding(self._get_model_info(model).encoding_name)
 
-    def _get_pricing(self, model: str) -> dict[str, float]:
-        return MODEL_PRICING.get(model, MODEL_PRICING["default"])
+    def _get_pricing(self, model: str) -> tuple[float, float]:
+        """Return (input, output) per-token rates for a model."""
+        info = self._get_model_info(model)
+        return info.in_rate, info.out_rate
 
     def count_tokens(self, text: str, model: str = "default") -> int:
         """Count tokens in text using tiktoken."""
+        return self._count(self._get_model_info(model), text)
+
+    @staticmethod
+    def _count(info: _ModelInfo, text: str) -> int:
+        """Count tokens given an already-resolved model info."""
+        if len(text) < _COUNT_CACHE_MAX_TEXT_LEN:
+            return _cached_count(info.encoding_name, text)
+        # encode_ordinary skips the special-token scan — faster on plain text
+        return len(_load_encoding(info.encoding_name).encode_ordinary(text))
+
+    def count_tokens_batch(self, texts: Sequence[str], model: str = "default") -> list[int]:
+        """
+        Count tokens for many texts in one call.
+
+        tiktoken's batch API releases the GIL and tokenizes across threads
+        in its Rust core, so this beats a Python loop of count_tokens calls.
+        """
+        if not texts:
+            return []
         encoder = self._get_encoder(model)
-        return len(encoder.encode(text))
+        encoded = encoder.encode_ordinary_batch(list(texts), num_threads=os.cpu_count() or 4)
+        return [len(tokens) for tokens in encoded]
+
+    def estimate_cost_batch(
+        self,
+        model: str,
+        input_tokens: Sequence[int] | None = None,
+        output_tokens: Sequence[int] | None = None,
+        input_texts: Sequence[str] | None = None,
+        output_texts: Sequence[str] | None = None,
+    ) -> list[CostEstimate]:
+        """
+        Estimate costs for a batch of planned actions.
+        Accepts either token counts or texts, mirroring estimate_cost.
+        """
+        if input_tokens is None:
+            input_tokens = self.count_tokens_batch(input_texts or [], model)
+        if output_tokens is None:
+            if output_texts is not None:
+                output_tokens = self.count_tokens_batch(output_texts, model)
+            else:
+                output_tokens = [0] * len(input_tokens)
+
+        in_rate, out_rate = self._get_pricing(model)
+        estimates = []
+        for in_tok, out_tok in zip(input_tokens, output_tokens):
+            input_cost = in_tok * in_rate
+            output_cost = out_tok * out_rate
+            estimates.append(CostEstimate(
+                input_tokens=in_tok,
+                output_tokens=out_tok,
+                input_cost=input_cost,
+                output_cost=output_cost,
+                total_cost=input_cost + output_cost,
+                model=model,
+            ))
+        return estimates
 
     def estimate_cost(
         self,
@@ -129,15 +250,23 @@ class CostTracker:
         """
         Estimate the cost of an LLM call.
         Accepts either token counts directly or text to count.
+
+        When both token counts are passed directly, the result comes
+        from a shared cache (CostEstimate is frozen, so sharing is safe).
         """
+        # Known-token path: repeated (model, in, out) triples are O(1)
+        if input_tokens is not None and output_tokens is not None:
+            return _cached_estimate(model, input_tokens, output_tokens)
+
+        # Resolve the model once for counting and pricing alike
+        info = self._get_model_info(model)
         if input_tokens is None:
-            input_tokens = self.count_tokens(input_text or "", model)
+            input_tokens = self._count(info, input_text or "")
         if output_tokens is None:
-            output_tokens = self.count_tokens(output_text or "", model)
+            output_tokens = self._count(info, output_text or "")
 
-        pricing = self._get_pricing(model)
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
+        input_cost = input_tokens * info.in_rate
+        output_cost = output_tokens * info.out_rate
 
         return CostEstimate(
             input_tokens=input_tokens,
@@ -208,3 +337,24 @@ class CostTracker:
             budget_remaining=remaining - estimated_action_cost,
             alert=alert,
         )
+
+    def check_budget_batch(
+        self,
+        session_costs: Sequence[float],
+        action_costs: Sequence[float],
+        max_cost_per_session: float,
+        max_cost_per_action: float | None = None,
+        alert_threshold: float = 0.8,
+    ) -> list[BudgetDecision]:
+        """
+        Evaluate many (session_cost, action_cost) pairs against one budget.
+
+        Intended for bulk workloads like policy backtesting and replay,
+        where check_budget would otherwise be re-entered thousands of
+        times with identical limits.
+        """
+        check = self.check_budget
+        return [
+            check(s, a, max_cost_per_session, max_cost_per_action, alert_threshold)
+            for s, a in zip(session_costs, action_costs)
+        ]
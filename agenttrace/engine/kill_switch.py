@@ -12,20 +12,105 @@ This is the circuit breaker pattern applied to AI agents.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable
 
 import httpx
 
+from agenttrace.engine import _json as _jsonlib
 from agenttrace.engine.session import Session
 
 logger = logging.getLogger("agenttrace.kill_switch")
 
+# Shared background event loop for execute_sync. One daemon thread per
+# process instead of a fresh ThreadPoolExecutor + asyncio.run bootstrap
+# per kill; this also keeps the AsyncClient connection pool warm across
+# sync kills since they all land on the same loop.
+_bg_loop_lock = threading.Lock()
+_bg_loop: asyncio.AbstractEventLoop | None = None
 
-@dataclass
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background loop, starting it on demand."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="agenttrace-kill-switch-loop",
+                daemon=True,
+            ).start()
+            _bg_loop = loop
+    return _bg_loop
+
+
+# Static part of the Slack payload — identical for every kill, so build
+# it once at import instead of per event. Never mutate it.
+_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🛑 AgentTrace: Session Killed",
+    },
+}
+
+# Circuit-breaker tuning for notification destinations.
+_BREAKER_FAILURE_THRESHOLD = 5      # consecutive failures before opening
+_BREAKER_BASE_COOLDOWN_S = 30.0     # first open duration
+_BREAKER_MAX_COOLDOWN_S = 600.0     # cap for the exponential backoff
+
+
+@dataclass(slots=True)
+class _Breaker:
+    """
+    Per-destination circuit breaker (CLOSED / OPEN / HALF-OPEN).
+
+    CLOSED: requests flow normally. After _BREAKER_FAILURE_THRESHOLD
+    consecutive failures the breaker OPENs and requests are skipped
+    instantly for a cooldown that doubles on each re-open. Once the
+    cooldown elapses, a single HALF-OPEN probe decides whether to
+    close again or re-open with a longer cooldown.
+    """
+    failures: int = 0
+    opened_at: float = 0.0
+    cooldown_s: float = 0.0
+    probing: bool = False
+
+    def allow(self) -> bool:
+        if self.cooldown_s == 0.0:
+            return True  # CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown_s:
+            return False  # OPEN
+        if self.probing:
+            return False  # HALF-OPEN, probe already in flight
+        self.probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.cooldown_s = 0.0
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.probing = False
+        if self.failures >= _BREAKER_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+            self.cooldown_s = (
+                _BREAKER_BASE_COOLDOWN_S
+                if self.cooldown_s == 0.0
+                else min(self.cooldown_s * 2, _BREAKER_MAX_COOLDOWN_S)
+            )
+            self.failures = _BREAKER_FAILURE_THRESHOLD - 1  # one probe re-opens
+
+
+@dataclass(slots=True)
 class KillEvent:
     """Record of a session termination."""
     session_id: str
@@ -50,6 +135,10 @@ class KillEvent:
             "notifications_sent": self.notifications_sent,
         }
 
+    def to_bytes(self) -> bytes:
+        """Event pre-encoded as JSON bytes (orjson when installed)."""
+        return _jsonlib.dumps_bytes(self.to_dict())
+
 
 class KillSwitch:
     """
@@ -75,55 +164,103 @@ class KillSwitch:
         self.grace_period_seconds = grace_period_seconds
         self._on_kill_callbacks = on_kill or []
         self._kill_history: list[KillEvent] = []
+        # Long-lived HTTP client so webhook sends reuse keep-alive
+        # connections instead of paying a TCP + TLS handshake per kill.
+        # Created lazily on first use so construction stays sync-safe.
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # One breaker per destination so a dead Slack endpoint can't
+        # add its full timeout to every subsequent kill.
+        self._breakers: dict[str, _Breaker] = {}
+        # In-flight notification fanouts scheduled by execute_nowait;
+        # drain() waits on these at shutdown.
+        self._pending: list[concurrent.futures.Future] = []
 
-    async def execute(self, session: Session, reason: str) -> KillEvent:
-        """
-        Execute the kill switch on a session.
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, (re)creating it if needed.
 
-        1. Mark session as killed
-        2. Fire all webhook notifications
-        3. Record the kill event
-        4. Call registered callbacks
+        The client is bound to the event loop it was created on; if we
+        find ourselves on a different loop (e.g. repeated asyncio.run
+        calls), a fresh client replaces the stale one.
         """
-        # 1. Kill the session
-        session.kill(reason)
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            stale, stale_loop = self._client, self._client_loop
+            if stale is not None and stale_loop is not None and not stale_loop.is_closed():
+                # Close the stale client on the loop that owns its pool
+                # so its keep-alive connections are released rather than
+                # leaked; best-effort, the result is not awaited.
+                try:
+                    asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+                except RuntimeError:
+                    pass  # loop shut down between the check and the call
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                # Default pool limits serialize simultaneous fanouts;
+                # raise them so every webhook target sends in parallel.
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
-        # 2. Build the kill event
-        event = KillEvent(
+    def _build_event(self, session: Session, reason: str) -> KillEvent:
+        return KillEvent(
             session_id=session.session_id,
             agent_id=session.agent_id,
             reason=reason,
             timestamp=time.time(),
             session_cost=session.total_cost,
             action_count=session.action_count,
-            violation_counts=session.violation_counts,
+            # Snapshot: the event is serialized later and must not
+            # alias the session's live mapping
+            violation_counts=dict(session.violation_counts),
             notifications_sent=[],
         )
 
-        # 3. Fire notifications (async, best-effort)
+    async def _notify(self, event: KillEvent) -> None:
+        """Fan out every notification for a kill event (best-effort).
+
+        The Slack payload is built once and shared; all destinations are
+        gathered in a single fanout so wall-clock cost is max-RTT, not
+        sum-of-RTTs. Results are appended to event.notifications_sent.
+        """
         notification_tasks = []
-        for webhook_url in self.webhooks:
-            notification_tasks.append(
-                self._send_webhook(webhook_url, event)
-            )
+        targets: list[tuple[str, str]] = []
+        if self.webhooks:
+            payload = self._format_slack_payload(event)
+            for webhook_url in self.webhooks:
+                notification_tasks.append(self._send_webhook(webhook_url, payload))
+                targets.append(("webhook", webhook_url))
+        for service_key in self.pagerduty_services:
+            notification_tasks.append(self._send_pagerduty(service_key, event))
+            targets.append(("pagerduty", service_key))
+
+        if not notification_tasks:
+            return
+        results = await asyncio.gather(*notification_tasks, return_exceptions=True)
+        for (kind, target), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"{kind} notification failed: {target} — {result}"
+                )
+                event.notifications_sent.append({
+                    "type": kind,
+                    "url": target,
+                    "status": "failed",
+                    "error": str(result),
+                })
+            else:
+                event.notifications_sent.append(result)
 
-        if notification_tasks:
-            results = await asyncio.gather(*notification_tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Webhook notification failed: {self.webhooks[i]} — {result}"
-                    )
-                    event.notifications_sent.append({
-                        "type": "webhook",
-                        "url": self.webhooks[i],
-                        "status": "failed",
-                        "error": str(result),
-                    })
-                else:
-                    event.notifications_sent.append(result)
-
-        # 4. Record and callback
+    def _record(self, event: KillEvent, session: Session) -> None:
+        """Append to history, run callbacks, and log the kill."""
         self._kill_history.append(event)
         for callback in self._on_kill_callbacks:
             try:
@@ -133,41 +270,118 @@ class KillSwitch:
 
         logger.warning(
             f"🛑 SESSION KILLED | {session.session_id} | "
-            f"Agent: {session.agent_id} | Reason: {reason} | "
+            f"Agent: {session.agent_id} | Reason: {event.reason} | "
             f"Cost: ${session.total_cost:.4f} | Actions: {session.action_count}"
         )
 
+    async def execute(self, session: Session, reason: str) -> KillEvent:
+        """
+        Execute the kill switch on a session.
+
+        1. Mark session as killed
+        2. Fire all webhook notifications (awaited)
+        3. Record the kill event
+        4. Call registered callbacks
+        """
+        session.kill(reason)
+        event = self._build_event(session, reason)
+        await self._notify(event)
+        self._record(event, session)
         return event
 
     def execute_sync(self, session: Session, reason: str) -> KillEvent:
-        """Synchronous version — creates event loop if needed."""
+        """Synchronous version — runs on the shared background loop."""
+        future = asyncio.run_coroutine_threadsafe(
+            self.execute(session, reason), _background_loop()
+        )
+        return future.result()
+
+    def execute_nowait(self, session: Session, reason: str) -> KillEvent:
+        """
+        Kill the session immediately; notify in the background.
+
+        The state transition — what actually stops the agent — happens
+        synchronously in the caller's thread, so enforcement never waits
+        on Slack/PagerDuty round-trips. The notification fanout is
+        scheduled on the shared background loop and patches statuses
+        into the returned event's notifications_sent as they complete;
+        call drain() (AgentTrace.close does) before shutdown to give
+        in-flight sends a bounded chance to finish.
+        """
+        session.kill(reason)
+        event = self._build_event(session, reason)
+        self._record(event, session)
+        if self.webhooks or self.pagerduty_services:
+            future = asyncio.run_coroutine_threadsafe(
+                self._notify(event), _background_loop()
+            )
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+        return event
+
+    def drain(self, timeout: float = 2.0) -> None:
+        """Wait up to `timeout` seconds for background notifications."""
+        pending = [f for f in self._pending if not f.done()]
+        if pending:
+            concurrent.futures.wait(pending, timeout=timeout)
+        self._pending = [f for f in self._pending if not f.done()]
+
+    async def _post_with_breaker(
+        self, kind: str, key: str, url: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """POST through the destination's circuit breaker."""
+        breaker = self._breakers.setdefault(key, _Breaker())
+        if not breaker.allow():
+            return {"type": kind, "url": key, "status": "skipped", "reason": "circuit_open"}
         try:
-            asyncio.get_running_loop()
-            # We're already in an async context, schedule it
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(
-                    asyncio.run, self.execute(session, reason)
-                ).result()
-        except RuntimeError:
-            return asyncio.run(self.execute(session, reason))
-
-    async def _send_webhook(self, url: str, event: KillEvent) -> dict[str, Any]:
-        """Send a webhook notification (Slack-compatible format)."""
-        payload = self._format_slack_payload(event)
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
+            # Serialize ourselves (orjson when installed) instead of
+            # letting httpx run the payload through stdlib json
+            response = await self._get_client().post(
                 url,
-                json=payload,
+                content=_jsonlib.dumps_bytes(payload),
                 headers={"Content-Type": "application/json"},
             )
-            return {
-                "type": "webhook",
-                "url": url,
-                "status": "sent" if response.is_success else "failed",
-                "status_code": response.status_code,
-            }
+        except Exception:
+            breaker.record_failure()
+            raise
+        if response.is_success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return {
+            "type": kind,
+            "url": key,
+            "status": "sent" if response.is_success else "failed",
+            "status_code": response.status_code,
+        }
+
+    async def _send_webhook(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send a webhook notification with a pre-built payload."""
+        return await self._post_with_breaker("webhook", url, url, payload)
+
+    _PAGERDUTY_EVENTS_URL = "https://events.pagerduty.com/v2/enqueue"
+
+    async def _send_pagerduty(self, routing_key: str, event: KillEvent) -> dict[str, Any]:
+        """Trigger a PagerDuty incident via the Events API v2."""
+        payload = {
+            "routing_key": routing_key,
+            "event_action": "trigger",
+            "dedup_key": f"agenttrace-kill-{event.session_id}",
+            "payload": {
+                "summary": f"Agent session killed: {event.agent_id} — {event.reason}",
+                "source": "agenttrace",
+                "severity": "critical",
+                "custom_details": {
+                    "session_id": event.session_id,
+                    "session_cost_usd": event.session_cost,
+                    "action_count": event.action_count,
+                    "violation_counts": event.violation_counts,
+                },
+            },
+        }
+        return await self._post_with_breaker(
+            "pagerduty", routing_key, self._PAGERDUTY_EVENTS_URL, payload
+        )
 
     @staticmethod
     def _format_slack_payload(event: KillEvent) -> dict[str, Any]:
@@ -179,13 +393,7 @@ class KillSwitch:
         return {
             "text": f"🛑 Agent Session Killed: {event.agent_id}",
             "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "🛑 AgentTrace: Session Killed",
-                    },
-                },
+                _HEADER_BLOCK,
                 {
                     "type": "section",
                     "fields": [
@@ -11,6 +11,11 @@ a policy engine's job. That's what we do.
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -18,6 +23,28 @@ from typing import Any
 
 import yaml
 
+# libyaml's C loader parses several times faster than the pure-Python
+# default; fall back when PyYAML was built without it.
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+
+# Duration grammar: one or more number+unit terms ('1h30m'), where a
+# bare trailing number means seconds.
+_DURATION_TERM_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([smhd]?)")
+_DURATION_RE = re.compile(r"\s*(?:\d+(?:\.\d+)?\s*[smhd]?\s*)+")
+_DURATION_UNITS = {"": 1.0, "s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file, cached on (path, mtime) so unchanged files
+    are free to reload."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class PolicyAction(str, Enum):
     """What to do when a threshold is breached."""
@@ -27,7 +54,7 @@ class PolicyAction(str, Enum):
     BLOCK = "block"     # Block this action but continue session
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetPolicy:
     max_cost_per_session: float = 5.00
     max_cost_per_action: float = 0.50
@@ -35,20 +62,20 @@ class BudgetPolicy:
     on_exceed: PolicyAction = PolicyAction.KILL
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPolicy:
     max_duration_seconds: int = 1800  # 30 minutes
     max_actions: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ViolationThreshold:
     violation_type: str
     max_count: int
     on_threshold: PolicyAction = PolicyAction.KILL
 
 
-@dataclass
+@dataclass(slots=True)
 class KillSwitchPolicy:
     enabled: bool = True
     webhooks: list[str] = field(default_factory=list)
@@ -56,7 +83,7 @@ class KillSwitchPolicy:
     grace_period_seconds: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditPolicy:
     enabled: bool = True
     include_fields: list[str] = field(default_factory=lambda: [
@@ -66,7 +93,7 @@ class AuditPolicy:
     file_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """Complete policy configuration for an agent."""
     version: str = "1.0"
@@ -84,14 +111,30 @@ class Policy:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     """Result of evaluating session state against policy."""
     action_allowed: bool
     action_taken: PolicyAction
     reason: str
     violation_type: str | None = None
+    # Cumulative count for violation_type at evaluation time, so callers
+    # can surface "2 of 3" without re-reading session state.
+    violation_count: int | None = None
     session_state_snapshot: dict[str, Any] = field(default_factory=dict)
+    # Input token count computed during pre-action cost estimation, so
+    # post_action can reuse it instead of retokenizing the same text.
+    input_tokens: int | None = None
+
+
+# Shared decision for the steady-state "nothing triggered" outcome, so the
+# hot path doesn't allocate a fresh dataclass + snapshot dict per action.
+# Callers may compare against it by identity to skip their own branching.
+ALLOWED_DECISION = PolicyDecision(
+    action_allowed=True,
+    action_taken=PolicyAction.LOG,
+    reason="Action within policy limits",
+)
 
 
 class PolicyEngine:
@@ -106,20 +149,53 @@ class PolicyEngine:
 
     def __init__(self, policy: Policy):
         self.policy = policy
+        # Flatten the per-action thresholds into scalars once, so the
+        # hot path does local attribute reads instead of walking
+        # policy.budget.* / policy.session.* dataclass chains, and the
+        # alert comparison needs no per-call division.
+        self._max_cost_session = policy.budget.max_cost_per_session
+        self._max_cost_action = policy.budget.max_cost_per_action
+        self._on_exceed = policy.budget.on_exceed
+        self._max_actions = policy.session.max_actions
+        self._max_duration_s = policy.session.max_duration_seconds
+        self._alert_cost_threshold = (
+            policy.budget.max_cost_per_session * policy.budget.alert_at
+        )
+        self._violation_map = {
+            vt.violation_type: vt for vt in policy.violation_thresholds
+        }
+        # Specialize the hot evaluator for this exact policy: thresholds
+        # are baked into the closure and checks the policy disables are
+        # compiled out instead of being re-tested per action.
+        self.evaluate_pre_action = self._compile_pre_action()
+
+    def get_violation_threshold(self, violation_type: str) -> ViolationThreshold | None:
+        """O(1) threshold lookup via the map built at construction."""
+        return self._violation_map.get(violation_type)
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> PolicyEngine:
         """Load policy from a YAML file."""
-        with open(path) as f:
-            raw = yaml.safe_load(f)
+        path = str(path)
+        raw = _load_yaml(path, os.stat(path).st_mtime_ns)
         policy = cls._parse_policy(raw)
         return cls(policy)
 
     @classmethod
     def from_dict(cls, raw: dict[str, Any]) -> PolicyEngine:
-        """Load policy from a dictionary."""
-        policy = cls._parse_policy(raw)
-        return cls(policy)
+        """Load policy from a dictionary.
+
+        Identical configs share one engine: the instance is immutable
+        after construction (scalars + a compiled closure), so repeated
+        loads — fleets instantiating the same policy, tests — skip the
+        dict walk and evaluator compilation.
+        """
+        try:
+            key = json.dumps(raw, sort_keys=True)
+        except (TypeError, ValueError):
+            # Non-JSON values in the config: build uncached
+            return cls(cls._parse_policy(raw))
+        return _engine_from_json(key)
 
     @classmethod
     def _parse_policy(cls, raw: dict[str, Any]) -> Policy:
@@ -155,7 +231,10 @@ class PolicyEngine:
             )
             for vtype, max_count in raw["violations"]["thresholds"].items():
                 policy.violation_thresholds.append(ViolationThreshold(
-                    violation_type=vtype,
+                    # Interned to match the interning in
+                    # Session.record_violation: threshold lookups then
+                    # compare by identity, not character-by-character
+                    violation_type=sys.intern(vtype),
                     max_count=max_count,
                     on_threshold=default_action,
                 ))
@@ -202,107 +281,185 @@ class PolicyEngine:
         return policy
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _parse_duration(value: str | int | float) -> float:
-        """Parse duration string (e.g. '30m', '5s', '1h') to seconds."""
-        if isinstance(value, (int, float)):
-            return float(value)
-        value = str(value).strip().lower()
-        if value.endswith("s"):
-            return float(value[:-1])
-        elif value.endswith("m"):
-            return float(value[:-1]) * 60
-        elif value.endswith("h"):
-            return float(value[:-1]) * 3600
-        return float(value)
-
-    def evaluate_pre_action(
-        self,
-        session_total_cost: float,
-        session_action_count: int,
-        session_duration: float,
-        estimated_cost: float,
-        action_name: str,
-    ) -> PolicyDecision:
         """
-        Evaluate whether an action should proceed, BEFORE execution.
-        Checks: budget, action count, session duration.
-        """
-        snapshot = {
-            "total_cost": session_total_cost,
-            "action_count": session_action_count,
-            "duration_seconds": session_duration,
-            "estimated_cost": estimated_cost,
-            "action": action_name,
-        }
-
-        # Check session duration
-        if session_duration > self.policy.session.max_duration_seconds:
-            return PolicyDecision(
-                action_allowed=False,
-                action_taken=PolicyAction.KILL,
-                reason=(
-                    f"Session duration {session_duration:.0f}s exceeds "
-                    f"limit {self.policy.session.max_duration_seconds}s"
-                ),
-                session_state_snapshot=snapshot,
-            )
+        Parse a duration to seconds.
 
-        # Check action count
-        if session_action_count >= self.policy.session.max_actions:
-            return PolicyDecision(
-                action_allowed=False,
-                action_taken=PolicyAction.KILL,
-                reason=(
-                    f"Action count {session_action_count} reached "
-                    f"limit {self.policy.session.max_actions}"
-                ),
-                session_state_snapshot=snapshot,
-            )
+        Accepts bare numbers (seconds), single units ('30m', '5s',
+        '1h', '2d') and compound forms ('1h30m').
 
-        # Check per-action cost
-        if estimated_cost > self.policy.budget.max_cost_per_action:
-            return PolicyDecision(
-                action_allowed=False,
-                action_taken=PolicyAction.BLOCK,
-                reason=(
-                    f"Action cost ${estimated_cost:.4f} exceeds "
-                    f"per-action limit ${self.policy.budget.max_cost_per_action:.4f}"
-                ),
-                session_state_snapshot=snapshot,
-            )
+        Memoized: fleets loading many policies repeat the same handful
+        of literals ('30m', '5s'), so repeats skip the regex entirely.
+        """
+        if isinstance(value, (int, float)):
+            return float(value)
+        text = str(value).strip().lower()
+        if not _DURATION_RE.fullmatch(text):
+            raise ValueError(f"Invalid duration: {value!r}")
+        return sum(
+            float(number) * _DURATION_UNITS[unit]
+            for number, unit in _DURATION_TERM_RE.findall(text)
+        )
 
-        # Check session budget
-        cost_after = session_total_cost + estimated_cost
-        if cost_after > self.policy.budget.max_cost_per_session:
-            return PolicyDecision(
-                action_allowed=False,
-                action_taken=self.policy.budget.on_exceed,
-                reason=(
-                    f"Session cost would reach ${cost_after:.4f}, "
-                    f"exceeding budget ${self.policy.budget.max_cost_per_session:.2f}"
-                ),
-                session_state_snapshot=snapshot,
+    def _compile_pre_action(self):
+        """
+        Build the evaluate_pre_action function specialized for this
+        policy (partial evaluation).
+
+        The thresholds live in the closure as plain locals, and checks
+        this policy cannot trigger (an unset per-action limit, an alert
+        fraction of 1.0+) become comparisons against +inf, which never
+        fire and cost no branch. The result is bound to
+        self.evaluate_pre_action in __init__.
+        """
+        max_duration_s = self._max_duration_s
+        max_actions = self._max_actions
+        max_cost_action = self._max_cost_action
+        max_cost_session = self._max_cost_session
+        alert_threshold = self._alert_cost_threshold
+        on_exceed = self._on_exceed
+
+        # Checks this policy can never trigger compile to comparisons
+        # against +inf, which are always false without a branch.
+        if max_cost_action is None:
+            max_cost_action = float("inf")
+        if alert_threshold >= max_cost_session:
+            alert_threshold = float("inf")
+
+        # Green zone: the tightest cost limit that could fire. While
+        # projected cost stays strictly below it (and count/duration are
+        # in bounds) no check can trigger, so the evaluator can return
+        # the shared decision after three comparisons. Sound because
+        # estimated_cost <= cost_after, so cost_after < green_cost also
+        # clears the per-action limit.
+        green_cost = min(alert_threshold, max_cost_session, max_cost_action)
+
+        def evaluate_pre_action(
+            session_total_cost: float,
+            session_action_count: int,
+            session_duration: float,
+            estimated_cost: float,
+            action_name: str,
+            need_snapshot: bool = False,
+        ) -> PolicyDecision:
+            """
+            Evaluate whether an action should proceed, BEFORE execution.
+            Checks: budget, action count, session duration.
+
+            Returns the shared ALLOWED_DECISION singleton when nothing
+            triggers — the overwhelmingly common case — so no snapshot
+            dict or decision object is allocated per action. Callers
+            that need a populated session_state_snapshot on the allow
+            path (e.g. for auditing) pass need_snapshot=True to get a
+            fresh decision instead.
+            """
+            # Green-zone short-circuit: well under every limit, which is
+            # the overwhelmingly common case. Short-circuiting `and`s
+            # beat the full bitmask below when nothing is close to
+            # triggering.
+            cost_after = session_total_cost + estimated_cost
+            if (
+                not need_snapshot
+                and cost_after < green_cost
+                and session_action_count < max_actions
+                and session_duration <= max_duration_s
+            ):
+                return ALLOWED_DECISION
+
+            # All five checks folded into one bitmask: the steady-state
+            # path is a single composite expression plus one branch.
+            # Bit positions encode priority (lowest bit wins).
+            flags = (
+                (session_duration > max_duration_s)
+                | ((session_action_count >= max_actions) << 1)
+                | ((estimated_cost > max_cost_action) << 2)
+                | ((cost_after > max_cost_session) << 3)
+                | ((cost_after >= alert_threshold) << 4)
             )
-
-        # Check alert threshold
-        utilization = cost_after / self.policy.budget.max_cost_per_session
-        if utilization >= self.policy.budget.alert_at:
+            if not flags:
+                if not need_snapshot:
+                    return ALLOWED_DECISION
+                return PolicyDecision(
+                    action_allowed=True,
+                    action_taken=PolicyAction.LOG,
+                    reason="Action within policy limits",
+                    session_state_snapshot={
+                        "total_cost": session_total_cost,
+                        "action_count": session_action_count,
+                        "duration_seconds": session_duration,
+                        "estimated_cost": estimated_cost,
+                        "action": action_name,
+                    },
+                )
+
+            # Rare path: decode the highest-priority set bit
+            bit = (flags & -flags).bit_length()
+            snapshot: dict[str, Any] = {
+                "total_cost": session_total_cost,
+                "action_count": session_action_count,
+                "duration_seconds": session_duration,
+                "estimated_cost": estimated_cost,
+                "action": action_name,
+            }
+
+            if bit == 1:  # session duration exceeded
+                return PolicyDecision(
+                    action_allowed=False,
+                    action_taken=PolicyAction.KILL,
+                    reason=(
+                        f"Session duration {session_duration:.0f}s exceeds "
+                        f"limit {max_duration_s}s"
+                    ),
+                    session_state_snapshot=snapshot,
+                )
+
+            if bit == 2:  # action count reached
+                return PolicyDecision(
+                    action_allowed=False,
+                    action_taken=PolicyAction.KILL,
+                    reason=(
+                        f"Action count {session_action_count} reached "
+                        f"limit {max_actions}"
+                    ),
+                    session_state_snapshot=snapshot,
+                )
+
+            if bit == 3:  # per-action cost exceeded
+                return PolicyDecision(
+                    action_allowed=False,
+                    action_taken=PolicyAction.BLOCK,
+                    reason=(
+                        f"Action cost ${estimated_cost:.4f} exceeds "
+                        f"per-action limit ${max_cost_action:.4f}"
+                    ),
+                    session_state_snapshot=snapshot,
+                )
+
+            if bit == 4:  # session budget exceeded
+                return PolicyDecision(
+                    action_allowed=False,
+                    action_taken=on_exceed,
+                    reason=(
+                        f"Session cost would reach ${cost_after:.4f}, "
+                        f"exceeding budget ${max_cost_session:.2f}"
+                    ),
+                    session_state_snapshot=snapshot,
+                )
+
+            # bit == 5: alert threshold crossed
+            utilization = cost_after / max_cost_session
             return PolicyDecision(
                 action_allowed=True,
                 action_taken=PolicyAction.ALERT,
                 reason=(
                     f"Budget utilization at {utilization:.0%} "
-                    f"(${cost_after:.4f} / ${self.policy.budget.max_cost_per_session:.2f})"
+                    f"(${cost_after:.4f} / ${max_cost_session:.2f})"
                 ),
                 session_state_snapshot=snapshot,
             )
 
-        return PolicyDecision(
-            action_allowed=True,
-            action_taken=PolicyAction.LOG,
-            reason="Action within policy limits",
-            session_state_snapshot=snapshot,
-        )
+        return evaluate_pre_action
 
     def evaluate_violation(
         self,
@@ -315,7 +472,7 @@ class PolicyEngine:
         This is the core of session-aware enforcement:
         "This is the 3rd PII block. Threshold is 3. Kill the session."
         """
-        threshold = self.policy.get_violation_threshold(violation_type)
+        threshold = self._violation_map.get(violation_type)
 
         if threshold is None:
             return PolicyDecision(
@@ -323,6 +480,7 @@ class PolicyEngine:
                 action_taken=PolicyAction.LOG,
                 reason=f"No threshold configured for '{violation_type}'",
                 violation_type=violation_type,
+                violation_count=cumulative_count,
             )
 
         if cumulative_count >= threshold.max_count:
@@ -334,6 +492,7 @@ class PolicyEngine:
                     f"reached threshold {threshold.max_count}"
                 ),
                 violation_type=violation_type,
+                violation_count=cumulative_count,
                 session_state_snapshot={
                     "violation_type": violation_type,
                     "count": cumulative_count,
@@ -349,4 +508,11 @@ class PolicyEngine:
                 f"below threshold {threshold.max_count}"
             ),
             violation_type=violation_type,
+            violation_count=cumulative_count,
         )
+
+
+@functools.lru_cache(maxsize=64)
+def _engine_from_json(config_json: str) -> PolicyEngine:
+    """Build (once) the engine for a canonical JSON-encoded config."""
+    return PolicyEngine(PolicyEngine._parse_policy(json.loads(config_json)))
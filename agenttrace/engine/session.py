@@ -11,12 +11,21 @@ This is the gap AgentTrace fills.
 
 from __future__ import annotations
 
+import sys
 import time
+import types
 import uuid
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict, deque
+from contextlib import nullcontext
+from itertools import islice
 from dataclasses import dataclass, field
 from enum import Enum
 from threading import Lock
-from typing import Any
+from typing import Any, Callable, Mapping
+
+from agenttrace.engine import _json as _jsonlib
 
 
 class SessionState(str, Enum):
@@ -28,24 +37,27 @@ class SessionState(str, Enum):
     EXPIRED = "expired"      # Max duration exceeded
 
 
-@dataclass
+@dataclass(slots=True)
 class ViolationRecord:
     """A single violation event."""
     violation_type: str
-    timestamp: float
-    details: dict[str, Any] = field(default_factory=dict)
+    timestamp_ns: int  # monotonic ns at record time (see Session.created_at_ns)
+    # Stored as handed in — callers may pass a shared read-only mapping
+    # (e.g. MappingProxyType) to avoid a dict allocation per violation
+    details: Mapping[str, Any] = field(default_factory=dict)
     action_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionRecord:
     """A single action taken by the agent."""
     action_name: str
-    timestamp: float
+    timestamp: int  # epoch ns (time.time_ns()); exported as seconds
     cost: float = 0.0
     blocked: bool = False
     block_reason: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    action_index: int = 0
 
 
 class Session:
@@ -66,66 +78,157 @@ class Session:
     - Full action history for audit
     """
 
+    __slots__ = (
+        "session_id", "agent_id", "state", "created_at", "created_at_ns",
+        "metadata", "_total_micro", "_violation_counts", "_action_names",
+        "_action_timestamps", "_action_costs", "_action_blocked",
+        "_action_reasons", "_action_metadata", "_violations",
+        "_kill_reason", "_lock", "on_terminal", "_event_log", "_event_seq",
+        "_violation_ts_by_type", "_clock",
+    )
+
     def __init__(
         self,
         session_id: str | None = None,
         agent_id: str = "default",
         metadata: dict[str, Any] | None = None,
+        thread_safe: bool = True,
+        clock: Callable[[], float] = time.time,
     ):
         self.session_id = session_id or str(uuid.uuid4())
         self.agent_id = agent_id
         self.state = SessionState.ACTIVE
-        self.created_at = time.time()
+        # Injectable wall clock: tests freeze it for determinism
+        self._clock = clock
+        self.created_at = clock()
+        # Monotonic epoch for duration math: immune to wall-clock jumps
+        # (NTP slews) and an integer subtract instead of float work.
+        self.created_at_ns = time.monotonic_ns()
         self.metadata = metadata or {}
 
-        # Cumulative state — the whole point of AgentTrace
-        self._total_cost: float = 0.0
-        self._action_count: int = 0
+        # Cumulative state — the whole point of AgentTrace.
+        # Cost accumulates in integer micro-USD: money sums stay exact
+        # (no 0.20 * 9 != 1.80 drift) and the hot-path add is integer.
+        self._total_micro: int = 0
         self._violation_counts: dict[str, int] = {}
-        self._actions: list[ActionRecord] = []
+        # Action history in columnar (struct-of-arrays) form: unboxed
+        # doubles for costs and one byte per blocked flag, instead of a
+        # full ActionRecord object (~hundreds of bytes) per action.
+        self._action_names: list[str] = []
+        self._action_timestamps: list[int] = []  # epoch ns
+        self._action_costs: array = array("d")
+        self._action_blocked: bytearray = bytearray()
+        self._action_reasons: list[str | None] = []
+        self._action_metadata: list[dict[str, Any]] = []
         self._violations: list[ViolationRecord] = []
+        # Per-type monotonic stamps, appended in order (so always
+        # sorted): lets time-window queries bisect instead of scanning
+        self._violation_ts_by_type: dict[str, list[int]] = defaultdict(list)
+        # Append-only ring of pre-serialized events for streaming
+        # exporters: each state change is encoded exactly once and
+        # consumers drain only what's new since their cursor.
+        self._event_log: deque[bytes] = deque(maxlen=10_000)
+        self._event_seq: int = 0  # total events ever appended
         self._kill_reason: str | None = None
+        # Set by SessionManager so it can evict terminal sessions from
+        # its live registry the moment they stop being active.
+        self.on_terminal: Callable[[Session], None] | None = None
 
-        self._lock = Lock()
+        # Single-threaded deployments (one event loop, no agent
+        # threads) can opt out of locking entirely; nullcontext keeps
+        # every `with self._lock:` site working unchanged.
+        self._lock = Lock() if thread_safe else nullcontext()
 
     @property
     def total_cost(self) -> float:
-        return self._total_cost
+        return self._total_micro / 1_000_000
 
     @property
     def action_count(self) -> int:
-        return self._action_count
+        return len(self._action_names)
 
     @property
-    def violation_counts(self) -> dict[str, int]:
-        return dict(self._violation_counts)
+    def violation_counts(self) -> types.MappingProxyType[str, int]:
+        # Read-only live view; no per-read dict copy. Callers that
+        # serialize or keep a snapshot must take dict(...) themselves.
+        return types.MappingProxyType(self._violation_counts)
+
+    def violation_count(self, violation_type: str) -> int:
+        """Cumulative count for one violation type (no dict copy)."""
+        return self._violation_counts.get(violation_type, 0)
+
+    def violation_count_since(self, violation_type: str, since_ns: int) -> int:
+        """
+        Count violations of a type recorded at or after a monotonic-ns
+        stamp (compare against time.monotonic_ns()).
+
+        O(log N) via bisect on the per-type stamp list — the building
+        block for sliding-window policies like "3 PII blocks in the
+        last 60s".
+        """
+        stamps = self._violation_ts_by_type.get(violation_type)
+        if not stamps:
+            return 0
+        return len(stamps) - bisect_left(stamps, since_ns)
 
     @property
     def duration(self) -> float:
         """Session duration in seconds."""
-        return time.time() - self.created_at
+        return (time.monotonic_ns() - self.created_at_ns) / 1e9
+
+    def duration_ns(self, now_ns: int | None = None) -> int:
+        """
+        Session duration in nanoseconds.
+
+        Callers doing several checks in one evaluation can snapshot
+        time.monotonic_ns() once and pass it in, paying a single clock
+        read per evaluation.
+        """
+        return (now_ns if now_ns is not None else time.monotonic_ns()) - self.created_at_ns
 
     @property
     def is_active(self) -> bool:
-        return self.state == SessionState.ACTIVE or self.state == SessionState.ALERT
+        return self.state is SessionState.ACTIVE or self.state is SessionState.ALERT
 
     @property
     def kill_reason(self) -> str | None:
         return self._kill_reason
 
     def record_action(self, action: ActionRecord) -> None:
-        """Record an action and update cumulative state."""
-        with self._lock:
-            if not self.is_active:
-                raise SessionKilledError(
-                    f"Session {self.session_id} is {self.state.value}: {self._kill_reason}"
-                )
-            action.action_index = self._action_count  # type: ignore[attr-defined]
-            self._actions.append(action)
-            self._action_count += 1
-            self._total_cost += action.cost
+        """
+        Record an action and update cumulative state.
 
-    def record_violation(self, violation_type: str, details: dict[str, Any] | None = None) -> int:
+        The is_active check stays unlocked: kill() transitions exactly
+        once, and an action racing the kill is indistinguishable from
+        one that landed just before it. The column appends and cost
+        accumulation share one short lock so the parallel arrays stay
+        row-aligned under concurrent writers.
+        """
+        if not self.is_active:
+            raise SessionKilledError(
+                f"Session {self.session_id} is {self.state.value}: {self._kill_reason}"
+            )
+        with self._lock:
+            action.action_index = len(self._action_names)
+            self._action_names.append(action.action_name)
+            self._action_timestamps.append(action.timestamp)
+            self._action_costs.append(action.cost)
+            self._action_blocked.append(1 if action.blocked else 0)
+            self._action_reasons.append(action.block_reason)
+            self._action_metadata.append(action.metadata)
+            self._total_micro += round(action.cost * 1_000_000)
+            self._append_event({
+                "type": "action",
+                "name": action.action_name,
+                "cost": action.cost,
+                "blocked": action.blocked,
+                "block_reason": action.block_reason,
+                "timestamp": action.timestamp,
+            })
+
+    def record_violation(
+        self, violation_type: str, details: Mapping[str, Any] | None = None
+    ) -> int:
         """
         Record a violation and return the new cumulative count for this type.
 
@@ -133,27 +236,64 @@ class Session:
         LangChain PIIMiddleware blocks PII — but it doesn't know this is the 3rd time.
         We do.
         """
+        # The same handful of type names recurs for the whole session;
+        # interning makes every dict operation below an identity hit
+        # instead of a string hash + compare.
+        violation_type = sys.intern(violation_type)
+        # Violations are rare compared to actions, and the cumulative
+        # count feeds threshold enforcement — keep the read-modify-write
+        # fully locked so two scanners can't both observe "count 2" when
+        # the threshold is 3.
         with self._lock:
             count = self._violation_counts.get(violation_type, 0) + 1
             self._violation_counts[violation_type] = count
+            # Monotonic stamp on the hot path; wall time is
+            # reconstructed once at audit export
+            now_ns = time.monotonic_ns()
             self._violations.append(ViolationRecord(
                 violation_type=violation_type,
-                timestamp=time.time(),
+                timestamp_ns=now_ns,
                 details=details or {},
-                action_index=self._action_count,
+                action_index=len(self._action_names),
             ))
+            self._violation_ts_by_type[violation_type].append(now_ns)
+            self._append_event({
+                "type": "violation",
+                "violation_type": violation_type,
+                "count": count,
+            })
             return count
 
+    def _append_event(self, event: dict[str, Any]) -> None:
+        """Serialize one state-change event into the ring (call locked)."""
+        self._event_log.append(_jsonlib.dumps_bytes(event))
+        self._event_seq += 1
+
+    def drain_events_since(self, cursor: int) -> list[bytes]:
+        """
+        Return the pre-serialized events appended after `cursor` (the
+        total number of events the caller has already consumed).
+
+        O(new events), no history rebuild. Advance the cursor by the
+        length of the returned list. If the caller fell more than the
+        ring size behind, the overwritten events are gone — the JSONL
+        audit file is the durable record.
+        """
+        oldest = self._event_seq - len(self._event_log)
+        start = max(cursor - oldest, 0)
+        return list(islice(self._event_log, start, None))
+
     def kill(self, reason: str) -> None:
         """Hard stop this session."""
         with self._lock:
             self.state = SessionState.KILLED
             self._kill_reason = reason
+        self._notify_terminal()
 
     def set_alert(self) -> None:
         """Mark session as in alert state (approaching limits)."""
         with self._lock:
-            if self.state == SessionState.ACTIVE:
+            if self.state is SessionState.ACTIVE:
                 self.state = SessionState.ALERT
 
     def complete(self) -> None:
@@ -161,6 +301,13 @@ class Session:
         with self._lock:
             if self.is_active:
                 self.state = SessionState.COMPLETED
+        self._notify_terminal()
+
+    def _notify_terminal(self) -> None:
+        """Tell the owning manager (if any) this session is terminal."""
+        callback = self.on_terminal
+        if callback is not None:
+            callback(self)
 
     def to_audit_dict(self) -> dict[str, Any]:
         """Export session state for audit logging."""
@@ -170,40 +317,74 @@ class Session:
             "state": self.state.value,
             "created_at": self.created_at,
             "duration_seconds": self.duration,
-            "total_cost_usd": round(self._total_cost, 6),
-            "action_count": self._action_count,
+            "total_cost_usd": self._total_micro / 1_000_000,
+            "action_count": len(self._action_names),
             "violation_counts": dict(self._violation_counts),
             "kill_reason": self._kill_reason,
             "actions": [
                 {
-                    "name": a.action_name,
-                    "cost": a.cost,
-                    "blocked": a.blocked,
-                    "block_reason": a.block_reason,
-                    "timestamp": a.timestamp,
+                    "name": name,
+                    "cost": cost,
+                    "blocked": bool(blocked),
+                    "block_reason": reason,
+                    # Stored as epoch ns; exported as epoch seconds so
+                    # actions, violations and created_at share one unit.
+                    "timestamp": ts / 1e9,
                 }
-                for a in self._actions
+                for name, cost, blocked, reason, ts in zip(
+                    self._action_names,
+                    self._action_costs,
+                    self._action_blocked,
+                    self._action_reasons,
+                    self._action_timestamps,
+                )
             ],
             "violations": [
                 {
                     "type": v.violation_type,
-                    "timestamp": v.timestamp,
+                    # Reconstruct wall time from the monotonic stamp:
+                    # one time.time() at session creation covers every
+                    # event recorded afterwards.
+                    "timestamp": self.created_at
+                    + (v.timestamp_ns - self.created_at_ns) / 1e9,
                     "details": v.details,
                 }
                 for v in self._violations
             ],
         }
 
+    def to_audit_bytes(self) -> bytes:
+        """
+        Audit export pre-encoded as JSON bytes (orjson when installed),
+        ready to hand to httpx via content= or to a file/OTel exporter
+        without a stdlib json re-encode.
+        """
+        return _jsonlib.dumps_bytes(self.to_audit_dict())
+
 
 class SessionManager:
     """
     Manages multiple concurrent sessions.
     Thread-safe session registry with lookup and cleanup.
+
+    The live registry is a bounded LRU: sessions are evicted from it
+    the moment they turn terminal (via Session.on_terminal) or, under
+    pressure, oldest-first. Terminal sessions are parked in a second
+    bounded map so lookups shortly after a kill still find them and
+    can report *why* the session is gone.
     """
 
-    def __init__(self):
-        self._sessions: dict[str, Session] = {}
-        self._lock = Lock()
+    __slots__ = (
+        "_sessions", "_recently_terminated", "_max_sessions",
+        "_thread_safe", "_lock",
+    )
+
+    def __init__(self, max_sessions: int = 10_000, thread_safe: bool = True):
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._recently_terminated: OrderedDict[str, Session] = OrderedDict()
+        self._max_sessions = max_sessions
+        self._thread_safe = thread_safe
+        self._lock = Lock() if thread_safe else nullcontext()
 
     def create_session(
         self,
@@ -211,16 +392,38 @@ class SessionManager:
         session_id: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> Session:
-        session = Session(session_id=session_id, agent_id=agent_id, metadata=metadata)
+        session = Session(
+            session_id=session_id,
+            agent_id=agent_id,
+            metadata=metadata,
+            thread_safe=self._thread_safe,
+        )
+        session.on_terminal = self._on_terminal
         with self._lock:
             self._sessions[session.session_id] = session
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
         return session
 
     def get_session(self, session_id: str) -> Session | None:
-        return self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._recently_terminated.get(session_id)
+        return session
+
+    def _on_terminal(self, session: Session) -> None:
+        """Move a now-terminal session out of the live registry."""
+        with self._lock:
+            # Insert before popping: get_session reads both maps without
+            # the lock, so the session must be findable in at least one
+            # of them at every instant.
+            self._recently_terminated[session.session_id] = session
+            self._sessions.pop(session.session_id, None)
+            while len(self._recently_terminated) > self._max_sessions:
+                self._recently_terminated.popitem(last=False)
 
     def kill_session(self, session_id: str, reason: str) -> bool:
-        session = self._sessions.get(session_id)
+        session = self.get_session(session_id)
         if session and session.is_active:
             session.kill(reason)
             return True
@@ -230,14 +433,21 @@ class SessionManager:
         return [s for s in self._sessions.values() if s.is_active]
 
     def cleanup_completed(self) -> int:
-        """Remove completed/killed sessions. Returns count removed."""
+        """Drop terminal sessions. Returns count removed.
+
+        Eviction happens eagerly on state transition, so this normally
+        just clears the recently-terminated parking lot; the live-dict
+        sweep only catches sessions whose terminal hook was unset.
+        """
         with self._lock:
-            to_remove = [
+            stale = [
                 sid for sid, s in self._sessions.items() if not s.is_active
             ]
-            for sid in to_remove:
+            for sid in stale:
                 del self._sessions[sid]
-            return len(to_remove)
+            removed = len(stale) + len(self._recently_terminated)
+            self._recently_terminated.clear()
+            return removed
 
 
 class SessionKilledError(Exception):
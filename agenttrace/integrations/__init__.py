@@ -0,0 +1,24 @@
+"""
+Framework integrations for AgentTrace.
+
+Submodules are imported lazily (PEP 562): importing agenttrace — or this
+package — never pays the framework's import cost. `langchain_core` alone
+adds hundreds of milliseconds of cold-start, which matters in serverless
+deployments that use AgentTrace without LangChain.
+"""
+
+from typing import Any
+
+_LANGCHAIN_EXPORTS = frozenset(
+    {"AgentTraceCallbackHandler", "AgentTraceAsyncCallbackHandler", "HAS_LANGCHAIN"}
+)
+
+__all__ = sorted(_LANGCHAIN_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LANGCHAIN_EXPORTS:
+        from agenttrace.integrations import langchain
+
+        return getattr(langchain, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
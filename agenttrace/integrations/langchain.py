@@ -26,6 +26,7 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -37,17 +38,24 @@ from agenttrace.engine.session import SessionKilledError
 
 logger = logging.getLogger("agenttrace.langchain")
 
+# Shared empty token-usage mapping so on_llm_end's common "no usage
+# reported" path allocates nothing. Read-only by convention.
+_EMPTY_USAGE: dict[str, Any] = {}
+
 try:
-    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackHandler
     from langchain_core.outputs import LLMResult
 
     HAS_LANGCHAIN = True
 except ImportError:
     HAS_LANGCHAIN = False
-    # Stub for when LangChain isn't installed
+    # Stubs for when LangChain isn't installed
     class BaseCallbackHandler:  # type: ignore[no-redef]
         pass
 
+    class AsyncCallbackHandler:  # type: ignore[no-redef]
+        pass
+
     class LLMResult:  # type: ignore[no-redef]
         pass
 
@@ -66,6 +74,10 @@ class AgentTraceCallbackHandler(BaseCallbackHandler):
     and AgentTrace's session-aware policy engine.
     """
 
+    # One handler per session: with thousands of parallel branches the
+    # per-instance __dict__ is measurable, so declare the attributes.
+    __slots__ = ("trace", "session_id", "model", "_current_action_start_ns")
+
     def __init__(
         self,
         agent_trace: AgentTrace,
@@ -81,7 +93,8 @@ class AgentTraceCallbackHandler(BaseCallbackHandler):
         self.trace = agent_trace
         self.session_id = session_id
         self.model = model
-        self._current_action_start: float | None = None
+        # Monotonic ns: immune to wall-clock steps, integer math
+        self._current_action_start_ns: int | None = None
 
     # ── LLM callbacks ─────────────────────────────────────────────
 
@@ -94,7 +107,7 @@ class AgentTraceCallbackHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Check budget before LLM call."""
-        self._current_action_start = time.time()
+        self._current_action_start_ns = time.monotonic_ns()
         input_text = "\n".join(prompts)
 
         try:
@@ -123,19 +136,30 @@ class AgentTraceCallbackHandler(BaseCallbackHandler):
         """Track cost after LLM call completes."""
         try:
             # Extract token usage if available
-            token_usage = {}
-            if hasattr(response, "llm_output") and response.llm_output:
-                token_usage = response.llm_output.get("token_usage", {})
+            llm_output = getattr(response, "llm_output", None)
+            token_usage = (
+                llm_output.get("token_usage") or _EMPTY_USAGE
+                if llm_output
+                else _EMPTY_USAGE
+            )
 
             input_tokens = token_usage.get("prompt_tokens", 0)
             output_tokens = token_usage.get("completion_tokens", 0)
 
+            start_ns = self._current_action_start_ns
+            self._current_action_start_ns = None
+            metadata = None
+            if start_ns is not None:
+                latency_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+                metadata = {"latency_ms": latency_ms}
+
             self.trace.post_action(
                 session_id=self.session_id,
                 action_name="llm_call",
                 model=self.model,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                metadata=metadata,
             )
         except SessionKilledError:
             raise
@@ -219,3 +243,100 @@ class AgentTraceCallbackHandler(BaseCallbackHandler):
             violation_type=violation_type,
             details=details,
         )
+
+
+class AgentTraceAsyncCallbackHandler(AsyncCallbackHandler):
+    """
+    Async variant of AgentTraceCallbackHandler for agents running in an
+    asyncio event loop (LangChain/LangGraph async executors).
+
+    Enforcement can touch audit file I/O, webhooks, and locks; running
+    it inline in async callbacks would stall the loop and serialize
+    concurrent branches. This handler delegates to the sync handler via
+    asyncio.to_thread so policy checks run cooperatively while keeping
+    a single implementation of the enforcement logic.
+    """
+
+    __slots__ = ("_sync", "trace", "session_id", "model")
+
+    def __init__(
+        self,
+        agent_trace: AgentTrace,
+        session_id: str,
+        model: str = "gpt-4o",
+    ):
+        super().__init__()
+        self._sync = AgentTraceCallbackHandler(
+            agent_trace=agent_trace, session_id=session_id, model=model
+        )
+        self.trace = agent_trace
+        self.session_id = session_id
+        self.model = model
+
+    async def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Check budget before LLM call (off the event loop)."""
+        await asyncio.to_thread(
+            self._sync.on_llm_start, serialized, prompts, run_id=run_id, **kwargs
+        )
+
+    async def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Track cost after LLM call completes (off the event loop)."""
+        await asyncio.to_thread(
+            self._sync.on_llm_end, response, run_id=run_id, **kwargs
+        )
+
+    async def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Record LLM errors as potential violations."""
+        self._sync.on_llm_error(error, run_id=run_id, **kwargs)
+
+    async def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Check policy before tool execution (off the event loop)."""
+        await asyncio.to_thread(
+            self._sync.on_tool_start, serialized, input_str, run_id=run_id, **kwargs
+        )
+
+    async def on_tool_end(
+        self,
+        output: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Record tool completion."""
+        pass  # Cost already tracked in pre_action estimate
+
+    def report_pii_violation(self, details: dict[str, Any] | None = None) -> None:
+        """See AgentTraceCallbackHandler.report_pii_violation."""
+        self._sync.report_pii_violation(details)
+
+    def report_violation(
+        self, violation_type: str, details: dict[str, Any] | None = None
+    ) -> None:
+        """Report any violation type to AgentTrace."""
+        self._sync.report_violation(violation_type, details)
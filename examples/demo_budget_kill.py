@@ -17,15 +17,17 @@ AgentTrace does all of this.
 Run: python examples/demo_budget_kill.py
 """
 
-import json
+import argparse
 import logging
 import sys
 import time
+import types
 
 # Add parent to path for development
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).parent.parent))
 
 from agenttrace import AgentTrace, SessionKilledError
+from agenttrace.engine import _json as _jsonlib
 
 # ── Setup logging ─────────────────────────────────────────────────
 
@@ -36,8 +38,41 @@ logging.basicConfig(
 )
 log = logging.getLogger("demo")
 
+# Shared read-only detail payload: a real PII scanner fires this for
+# every block, so don't build a fresh dict each time
+PII_DETAIL_EMAIL_REDACT = types.MappingProxyType(
+    {"field": "customer_email", "action": "redacted"}
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--simulate-latency",
+        type=float,
+        default=0.1,
+        metavar="SECONDS",
+        help="sleep per action to mimic real LLM latency; pass 0 for CI (default: 0.1)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1,
+        metavar="N",
+        help="repeat the scripted action list N times (default: 1)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="suppress per-action output (benchmark runs measure pure engine cost)",
+    )
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+    sim_latency = args.simulate_latency
+
     print("=" * 70)
     print("  AgentTrace Demo: Session-Aware Policy Enforcement")
     print("  The circuit breaker for AI agent sessions")
@@ -106,76 +141,98 @@ def main():
         ("unreachable",     "gpt-4o", 100,   50,   False),  # Should never execute
     ]
 
-    for i, (action_name, model, in_tokens, out_tokens, triggers_pii) in enumerate(actions):
-        print(f"─── Action {i+1}: {action_name} ───")
+    # Hoist loop-invariant policy attributes out of the hot loop
+    budget_max = trace.policy.budget.max_cost_per_session
+    pii_threshold = trace.policy.violation_thresholds[0].max_count
+
+    # The whole plan is known up front and uses one model, so estimate
+    # every action's cost in a single batch call before the loop
+    estimates = trace.cost_tracker.estimate_cost_batch(
+        model=actions[0][1],
+        input_tokens=[a[2] for a in actions],
+        output_tokens=[a[3] for a in actions],
+    )
+    n_actions = len(actions)
+
+    for i, (action_name, model, in_tokens, out_tokens, triggers_pii) in enumerate(
+        actions * args.iterations
+    ):
+        # Buffer the iteration's output and flush it in one write —
+        # under --iterations the 10+ prints per action dominate otherwise
+        out: list[str] = []
+        emit = out.append
+        try:
+            emit(f"─── Action {i+1}: {action_name} ───")
 
-        # Estimate cost
-        estimate = trace.cost_tracker.estimate_cost(
-            model=model, input_tokens=in_tokens, output_tokens=out_tokens
-        )
-        print(f"  📊 Estimated cost: ${estimate.total_cost:.4f} "
-              f"({in_tokens} in / {out_tokens} out tokens)")
+            # Cost was estimated in the batch call above
+            estimate = estimates[i % n_actions]
+            emit(f"  📊 Estimated cost: ${estimate.total_cost:.4f} "
+                 f"({in_tokens} in / {out_tokens} out tokens)")
 
-        # Pre-action check (BEFORE execution)
-        try:
-            decision = trace.pre_action(
-                session_id=session.session_id,
-                action_name=action_name,
-                estimated_cost=estimate.total_cost,
-            )
-        except SessionKilledError as e:
-            print(f"  🛑 SESSION ALREADY DEAD: {e}")
-            break
-
-        if not decision.action_allowed:
-            print(f"  ❌ BLOCKED: {decision.reason}")
-            print(f"  🛑 Action: {decision.action_taken.value}")
-            break
-
-        if decision.action_taken.value == "alert":
-            print(f"  ⚠️  ALERT: {decision.reason}")
-
-        # Simulate execution
-        print(f"  ✅ Executing {action_name}...")
-        time.sleep(0.1)  # Simulate work
-
-        # Post-action (record actual cost)
-        try:
-            trace.post_action(
-                session_id=session.session_id,
-                action_name=action_name,
-                model=model,
-                input_tokens=in_tokens,
-                output_tokens=out_tokens,
-            )
-        except SessionKilledError as e:
-            print(f"  🛑 SESSION KILLED during post-action: {e}")
-            break
-
-        print(f"  💰 Session total: ${session.total_cost:.4f} / "
-              f"${trace.policy.budget.max_cost_per_session:.2f}")
-
-        # Simulate PII violation (as if LangChain PIIMiddleware caught it)
-        if triggers_pii:
-            print(f"  🔍 PII detected by scanner! Recording violation...")
+            # Pre-action check (BEFORE execution)
             try:
-                v_decision = trace.record_violation(
+                decision = trace.pre_action(
                     session_id=session.session_id,
-                    violation_type="pii_blocked",
-                    details={"field": "customer_email", "action": "redacted"},
+                    action_name=action_name,
+                    estimated_cost=estimate.total_cost,
                 )
-                pii_count = session.violation_counts.get("pii_blocked", 0)
-                threshold = trace.policy.violation_thresholds[0].max_count
-                print(f"  🚨 PII violations: {pii_count} / {threshold}")
+            except SessionKilledError as e:
+                emit(f"  🛑 SESSION ALREADY DEAD: {e}")
+                break
 
-                if not v_decision.action_allowed:
-                    print(f"  🛑 THRESHOLD BREACHED: {v_decision.reason}")
-                    break
+            if not decision.action_allowed:
+                emit(f"  ❌ BLOCKED: {decision.reason}")
+                emit(f"  🛑 Action: {decision.action_taken.value}")
+                break
+
+            if decision.action_taken.value == "alert":
+                emit(f"  ⚠️  ALERT: {decision.reason}")
+
+            # Simulate execution
+            emit(f"  ✅ Executing {action_name}...")
+            if sim_latency:
+                time.sleep(sim_latency)  # Simulate work
+
+            # Post-action (record actual cost)
+            try:
+                trace.post_action(
+                    session_id=session.session_id,
+                    action_name=action_name,
+                    model=model,
+                    input_tokens=in_tokens,
+                    output_tokens=out_tokens,
+                )
             except SessionKilledError as e:
-                print(f"  🛑 SESSION KILLED: {e}")
+                emit(f"  🛑 SESSION KILLED during post-action: {e}")
                 break
 
-        print()
+            emit(f"  💰 Session total: ${session.total_cost:.4f} / "
+                 f"${budget_max:.2f}")
+
+            # Simulate PII violation (as if LangChain PIIMiddleware caught it)
+            if triggers_pii:
+                emit(f"  🔍 PII detected by scanner! Recording violation...")
+                try:
+                    v_decision = trace.record_violation(
+                        session_id=session.session_id,
+                        violation_type="pii_blocked",
+                        details=PII_DETAIL_EMAIL_REDACT,
+                    )
+                    # The decision carries the updated count — no need
+                    # to re-read session state
+                    emit(f"  🚨 PII violations: {v_decision.violation_count} / {pii_threshold}")
+
+                    if not v_decision.action_allowed:
+                        emit(f"  🛑 THRESHOLD BREACHED: {v_decision.reason}")
+                        break
+                except SessionKilledError as e:
+                    emit(f"  🛑 SESSION KILLED: {e}")
+                    break
+
+            emit("")
+        finally:
+            if not args.quiet:
+                sys.stdout.write("\n".join(out) + "\n")
 
     # ── 3. Print session summary ──────────────────────────────────
 
@@ -199,20 +256,20 @@ def main():
     # ── 4. Show audit log ─────────────────────────────────────────
 
     print("─── Audit Log ───")
-    for entry in trace.audit.entries:
-        d = entry.to_dict()
-        event = d.pop("event_type")
-        sid = d.pop("session_id")[:8]
-        agent = d.pop("agent_id")
-        ts = d.pop("timestamp")
-        # Filter to interesting fields
-        extras = {k: v for k, v in d.items() if v is not None}
-        print(f"  [{event:20s}] {json.dumps(extras, default=str)}")
+    for entry in trace.audit.iter_entries():
+        # details holds exactly the per-event fields; no need to rebuild
+        # a flat dict and pop the envelope back out of it
+        extras = {k: v for k, v in entry.details.items() if v is not None}
+        print(f"  [{entry.event_type:20s}] {_jsonlib.dumps(extras)}")
 
     print()
 
     # ── 5. Show kill switch history ───────────────────────────────
 
+    # Kills return before their webhooks finish; give the background
+    # sends a moment so the statuses below are populated
+    trace.kill_switch.drain()
+
     if trace.kill_switch.kill_history:
         print("─── Kill Switch Events ───")
         for event in trace.kill_switch.kill_history:
@@ -18,7 +18,7 @@ AgentTrace does.
 Run: python examples/demo_cost_kill.py
 """
 
-import json
+import argparse
 import logging
 import sys
 import time
@@ -26,6 +26,7 @@ import time
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).parent.parent))
 
 from agenttrace import AgentTrace, SessionKilledError
+from agenttrace.engine import _json as _jsonlib
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,7 +36,34 @@ logging.basicConfig(
 log = logging.getLogger("demo")
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--simulate-latency",
+        type=float,
+        default=0.1,
+        metavar="SECONDS",
+        help="sleep per action to mimic real LLM latency; pass 0 for CI (default: 0.1)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1,
+        metavar="N",
+        help="repeat the scripted action list N times (default: 1)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="suppress per-action output (benchmark runs measure pure engine cost)",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    sim_latency = args.simulate_latency
+
     print("=" * 70)
     print("  AgentTrace Demo: Budget Ceiling Kill")
     print("  Enterprise question: 'How do I enforce a budget per session?'")
@@ -93,63 +121,83 @@ def main():
         ("format_output",       "gpt-4o", 5000,  2000,  "Format for user"),          # Never reached
     ]
 
-    for i, (action_name, model, in_tokens, out_tokens, description) in enumerate(actions):
-        print(f"─── Action {i+1}: {action_name} ───")
-        print(f"  📝 {description}")
-
-        # Estimate cost before execution
-        estimate = trace.cost_tracker.estimate_cost(
-            model=model, input_tokens=in_tokens, output_tokens=out_tokens
-        )
-        print(f"  📊 Estimated: ${estimate.total_cost:.4f} "
-              f"({in_tokens:,} in / {out_tokens:,} out)")
-
-        # Pre-action budget check
-        try:
-            decision = trace.pre_action(
-                session_id=session.session_id,
-                action_name=action_name,
-                estimated_cost=estimate.total_cost,
-            )
-        except SessionKilledError as e:
-            print(f"  🛑 SESSION ALREADY DEAD: {e}")
-            break
-
-        if not decision.action_allowed:
-            print(f"  ❌ BLOCKED: {decision.reason}")
-            print(f"  🛑 Action: {decision.action_taken.value}")
-            break
-
-        if decision.action_taken.value == "alert":
-            utilization = session.total_cost / trace.policy.budget.max_cost_per_session
-            print(f"  ⚠️  BUDGET ALERT: {decision.reason}")
-
-        # Execute
-        print(f"  ✅ Executing...")
-        time.sleep(0.1)
-
-        # Record actual cost
+    # Hoist loop-invariant policy attributes out of the hot loop
+    budget_max = trace.policy.budget.max_cost_per_session
+
+    # The whole plan is known up front and uses one model, so estimate
+    # every action's cost in a single batch call before the loop
+    estimates = trace.cost_tracker.estimate_cost_batch(
+        model=actions[0][1],
+        input_tokens=[a[2] for a in actions],
+        output_tokens=[a[3] for a in actions],
+    )
+    n_actions = len(actions)
+
+    for i, (action_name, model, in_tokens, out_tokens, description) in enumerate(
+        actions * args.iterations
+    ):
+        # Buffer the iteration's output and flush it in one write —
+        # under --iterations the 10+ prints per action dominate otherwise
+        out: list[str] = []
+        emit = out.append
         try:
-            trace.post_action(
-                session_id=session.session_id,
-                action_name=action_name,
-                model=model,
-                input_tokens=in_tokens,
-                output_tokens=out_tokens,
-            )
-        except SessionKilledError as e:
-            print(f"  🛑 SESSION KILLED: {e}")
-            break
-
-        remaining = trace.policy.budget.max_cost_per_session - session.total_cost
-        utilization = session.total_cost / trace.policy.budget.max_cost_per_session
-        bar_len = 30
-        filled = int(bar_len * utilization)
-        bar = "█" * filled + "░" * (bar_len - filled)
-        print(f"  💰 [{bar}] ${session.total_cost:.4f} / "
-              f"${trace.policy.budget.max_cost_per_session:.2f} "
-              f"({utilization:.0%}) — ${remaining:.4f} remaining")
-        print()
+            emit(f"─── Action {i+1}: {action_name} ───")
+            emit(f"  📝 {description}")
+
+            # Cost was estimated in the batch call above
+            estimate = estimates[i % n_actions]
+            emit(f"  📊 Estimated: ${estimate.total_cost:.4f} "
+                 f"({in_tokens:,} in / {out_tokens:,} out)")
+
+            # Pre-action budget check
+            try:
+                decision = trace.pre_action(
+                    session_id=session.session_id,
+                    action_name=action_name,
+                    estimated_cost=estimate.total_cost,
+                )
+            except SessionKilledError as e:
+                emit(f"  🛑 SESSION ALREADY DEAD: {e}")
+                break
+
+            if not decision.action_allowed:
+                emit(f"  ❌ BLOCKED: {decision.reason}")
+                emit(f"  🛑 Action: {decision.action_taken.value}")
+                break
+
+            if decision.action_taken.value == "alert":
+                emit(f"  ⚠️  BUDGET ALERT: {decision.reason}")
+
+            # Execute
+            emit(f"  ✅ Executing...")
+            if sim_latency:
+                time.sleep(sim_latency)
+
+            # Record actual cost
+            try:
+                trace.post_action(
+                    session_id=session.session_id,
+                    action_name=action_name,
+                    model=model,
+                    input_tokens=in_tokens,
+                    output_tokens=out_tokens,
+                )
+            except SessionKilledError as e:
+                emit(f"  🛑 SESSION KILLED: {e}")
+                break
+
+            remaining = budget_max - session.total_cost
+            utilization = session.total_cost / budget_max
+            bar_len = 30
+            filled = int(bar_len * utilization)
+            bar = "█" * filled + "░" * (bar_len - filled)
+            emit(f"  💰 [{bar}] ${session.total_cost:.4f} / "
+                 f"${budget_max:.2f} "
+                 f"({utilization:.0%}) — ${remaining:.4f} remaining")
+            emit("")
+        finally:
+            if not args.quiet:
+                sys.stdout.write("\n".join(out) + "\n")
 
     # ── 3. Session summary ────────────────────────────────────────
     print()
@@ -171,14 +219,11 @@ def main():
 
     # ── 4. Audit trail ────────────────────────────────────────────
     print("─── Audit Log ───")
-    for entry in trace.audit.entries:
-        d = entry.to_dict()
-        event = d.pop("event_type")
-        d.pop("session_id", None)
-        d.pop("agent_id", None)
-        d.pop("timestamp", None)
-        extras = {k: v for k, v in d.items() if v is not None}
-        print(f"  [{event:20s}] {json.dumps(extras, default=str)}")
+    for entry in trace.audit.iter_entries():
+        # details holds exactly the per-event fields; no need to rebuild
+        # a flat dict and pop the envelope back out of it
+        extras = {k: v for k, v in entry.details.items() if v is not None}
+        print(f"  [{entry.event_type:20s}] {_jsonlib.dumps(extras)}")
     print()
 
     # ── 5. The point ──────────────────────────────────────────────
@@ -0,0 +1,23 @@
+"""Shared test configuration."""
+
+import os
+from pathlib import Path
+
+# Point tiktoken at a repo-local cache before anything imports it, so
+# token counting is deterministic and offline once the BPE blobs are in
+# tests/_tiktoken_cache (the first networked run populates it).
+os.environ.setdefault(
+    "TIKTOKEN_CACHE_DIR", str(Path(__file__).parent / "_tiktoken_cache")
+)
+
+
+def pytest_configure(config):
+    # Warm the encoding once at collection so cold CostTracker tests
+    # measure the BPE encode, not the table load. Best-effort: when the
+    # blob is absent offline, the tests' own skip logic handles it.
+    try:
+        import tiktoken
+
+        tiktoken.get_encoding("o200k_base")
+    except Exception:
+        pass
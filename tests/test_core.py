@@ -1,7 +1,9 @@
 """Tests for AgentTrace core components."""
 
+import json
+from pathlib import Path
+
 import pytest
-import time
 
 
 from agenttrace.engine.session import Session, SessionState, SessionKilledError
@@ -36,17 +38,19 @@ class TestSession:
         assert session.violation_counts == {"pii_blocked": 3}
 
     def test_kill_prevents_actions(self):
-        session = Session(agent_id="test-agent")
+        # Frozen clock: deterministic timestamps, no clock_gettime syscall
+        session = Session(agent_id="test-agent", clock=lambda: 123.0)
         session.kill("budget exceeded")
-        
+
         assert not session.is_active
         assert session.state == SessionState.KILLED
         assert session.kill_reason == "budget exceeded"
-        
+        assert session.created_at == 123.0
+
         from agenttrace.engine.session import ActionRecord
         with pytest.raises(SessionKilledError):
             session.record_action(ActionRecord(
-                action_name="test", timestamp=time.time(), cost=0.01
+                action_name="test", timestamp=0, cost=0.01
             ))
 
     def test_audit_dict(self):
@@ -64,11 +68,14 @@ class TestSession:
 class TestCostTracker:
     def test_token_counting(self):
         tracker = CostTracker()
+        # conftest.py points TIKTOKEN_CACHE_DIR at tests/_tiktoken_cache;
+        # the skip only fires when the blob isn't cached AND the network
+        # is unavailable — once loaded, the count is asserted exactly.
         try:
             count = tracker.count_tokens("Hello, world!", "gpt-4o")
-            assert count > 0
         except Exception:
-            pytest.skip("tiktoken encoding download requires network access")
+            pytest.skip("tiktoken BPE blob not cached and network unavailable")
+        assert count == 4  # "Hello" "," " world" "!"
 
     def test_cost_estimation(self):
         tracker = CostTracker()
@@ -84,60 +91,60 @@ class TestCostTracker:
         expected = (1000 / 1_000_000) * 2.50 + (500 / 1_000_000) * 10.00
         assert abs(estimate.total_cost - expected) < 0.0001
 
-    def test_budget_check_allowed(self):
-        tracker = CostTracker()
-        decision = tracker.check_budget(
-            session_total_cost=1.00,
-            estimated_action_cost=0.10,
-            max_cost_per_session=5.00,
-        )
-        assert decision.allowed
-        assert not decision.alert
-
-    def test_budget_check_blocked(self):
-        tracker = CostTracker()
-        decision = tracker.check_budget(
-            session_total_cost=4.80,
-            estimated_action_cost=0.30,
-            max_cost_per_session=5.00,
-        )
-        assert not decision.allowed
-        assert decision.reason is not None
-
-    def test_budget_check_alert(self):
+    @pytest.mark.parametrize("total,est,expect_allowed,expect_alert", [
+        (1.00, 0.10, True, False),   # well within budget
+        (4.80, 0.30, False, True),   # would exceed $5.00 → blocked
+        (4.00, 0.10, True, True),    # 4.10 / 5.00 = 82% > 80% → alert
+    ])
+    def test_budget_check(self, total, est, expect_allowed, expect_alert):
         tracker = CostTracker()
         decision = tracker.check_budget(
-            session_total_cost=4.00,
-            estimated_action_cost=0.10,
+            session_total_cost=total,
+            estimated_action_cost=est,
             max_cost_per_session=5.00,
             alert_threshold=0.80,
         )
-        assert decision.allowed
-        assert decision.alert  # 4.10 / 5.00 = 82% > 80%
+        assert decision.allowed is expect_allowed
+        assert decision.alert is expect_alert
+        if not expect_allowed:
+            assert decision.reason is not None
+
+        # The batch path must agree with the scalar path
+        (batched,) = tracker.check_budget_batch(
+            [total], [est], max_cost_per_session=5.00, alert_threshold=0.80
+        )
+        assert batched.allowed is decision.allowed
+        assert batched.alert is decision.alert
 
 
 # ── Policy Engine Tests ───────────────────────────────────────────
 
-class TestPolicyEngine:
-    def _make_engine(self) -> PolicyEngine:
-        return PolicyEngine.from_dict({
-            "version": "1.0",
-            "agent_id": "test",
-            "budget": {
-                "max_cost_per_session": 5.00,
-                "max_cost_per_action": 0.50,
-                "alert_at": 0.80,
-                "on_exceed": "kill",
+@pytest.fixture(scope="module")
+def policy_blob() -> dict:
+    """Base policy config, parsed once per module. The engine and trace
+    fixtures splice their per-suite overrides into this instead of each
+    restating the full dict."""
+    return json.loads(Path(__file__).with_name("policy_fixture.json").read_text())
+
+
+@pytest.fixture(scope="module")
+def engine(policy_blob) -> PolicyEngine:
+    """One engine for the whole module: evaluation is read-only, so the
+    policy parse + evaluator compilation need not repeat per test."""
+    return PolicyEngine.from_dict({
+        **policy_blob,
+        "violations": {
+            **policy_blob["violations"],
+            "thresholds": {
+                **policy_blob["violations"]["thresholds"],
+                "scope_violation": 1,
             },
-            "session": {"max_duration": "30m", "max_actions": 10},
-            "violations": {
-                "thresholds": {"pii_blocked": 3, "scope_violation": 1},
-                "on_threshold": "kill",
-            },
-        })
+        },
+    })
+
 
-    def test_action_within_budget(self):
-        engine = self._make_engine()
+class TestPolicyEngine:
+    def test_action_within_budget(self, engine):
         decision = engine.evaluate_pre_action(
             session_total_cost=1.00,
             session_action_count=2,
@@ -147,8 +154,7 @@ class TestPolicyEngine:
         )
         assert decision.action_allowed
 
-    def test_action_exceeds_budget(self):
-        engine = self._make_engine()
+    def test_action_exceeds_budget(self, engine):
         decision = engine.evaluate_pre_action(
             session_total_cost=4.80,
             session_action_count=5,
@@ -159,8 +165,7 @@ class TestPolicyEngine:
         assert not decision.action_allowed
         assert decision.action_taken == PolicyAction.KILL
 
-    def test_action_exceeds_per_action_limit(self):
-        engine = self._make_engine()
+    def test_action_exceeds_per_action_limit(self, engine):
         decision = engine.evaluate_pre_action(
             session_total_cost=1.00,
             session_action_count=2,
@@ -171,8 +176,7 @@ class TestPolicyEngine:
         assert not decision.action_allowed
         assert decision.action_taken == PolicyAction.BLOCK
 
-    def test_action_count_exceeded(self):
-        engine = self._make_engine()
+    def test_action_count_exceeded(self, engine):
         decision = engine.evaluate_pre_action(
             session_total_cost=1.00,
             session_action_count=10,  # = max
@@ -182,55 +186,47 @@ class TestPolicyEngine:
         )
         assert not decision.action_allowed
 
-    def test_violation_below_threshold(self):
-        engine = self._make_engine()
-        decision = engine.evaluate_violation("pii_blocked", 2)
-        assert decision.action_allowed
+    @pytest.mark.parametrize("name,count,allowed,taken", [
+        ("pii_blocked", 2, True, None),              # below threshold
+        ("pii_blocked", 3, False, PolicyAction.KILL),  # the core case: 3rd PII block → kill
+        ("unknown_violation", 100, True, None),      # no threshold → log only
+    ])
+    def test_violation(self, engine, name, count, allowed, taken):
+        decision = engine.evaluate_violation(name, count)
+        assert decision.action_allowed is allowed
+        if taken is not None:
+            assert decision.action_taken == taken
+
+    @pytest.mark.parametrize("raw,seconds", [
+        ("30m", 1800.0),
+        ("5s", 5.0),
+        ("1h", 3600.0),
+        (120, 120.0),
+    ])
+    def test_parse_duration(self, raw, seconds):
+        assert PolicyEngine._parse_duration(raw) == seconds
 
-    def test_violation_at_threshold(self):
-        """The core test: 3rd PII block → kill."""
-        engine = self._make_engine()
-        decision = engine.evaluate_violation("pii_blocked", 3)
-        assert not decision.action_allowed
-        assert decision.action_taken == PolicyAction.KILL
 
-    def test_violation_unknown_type(self):
-        engine = self._make_engine()
-        decision = engine.evaluate_violation("unknown_violation", 100)
-        assert decision.action_allowed  # No threshold → log only
-
-    def test_parse_duration(self):
-        assert PolicyEngine._parse_duration("30m") == 1800.0
-        assert PolicyEngine._parse_duration("5s") == 5.0
-        assert PolicyEngine._parse_duration("1h") == 3600.0
-        assert PolicyEngine._parse_duration(120) == 120.0
+# ── AgentTrace Integration Tests ──────────────────────────────────
 
+@pytest.fixture(scope="module")
+def trace(policy_blob) -> AgentTrace:
+    """One AgentTrace for the whole module. Every test creates its own
+    session, and the assertions below are all per-session (or use
+    entries_for_session), so sharing the engine stack is safe."""
+    return AgentTrace.from_dict({
+        **policy_blob,
+        "agent_id": "test-agent",
+        "budget": {**policy_blob["budget"], "max_cost_per_session": 2.00},
+        "session": {**policy_blob["session"], "max_actions": 50},
+        "kill_switch": {"enabled": True, "notify": [], "grace_period": "1s"},
+        "audit": {"enabled": True},
+    })
 
-# ── AgentTrace Integration Tests ──────────────────────────────────
 
 class TestAgentTrace:
-    def _make_trace(self) -> AgentTrace:
-        return AgentTrace.from_dict({
-            "version": "1.0",
-            "agent_id": "test-agent",
-            "budget": {
-                "max_cost_per_session": 2.00,
-                "max_cost_per_action": 0.50,
-                "alert_at": 0.80,
-                "on_exceed": "kill",
-            },
-            "session": {"max_duration": "30m", "max_actions": 50},
-            "violations": {
-                "thresholds": {"pii_blocked": 3},
-                "on_threshold": "kill",
-            },
-            "kill_switch": {"enabled": True, "notify": [], "grace_period": "1s"},
-            "audit": {"enabled": True},
-        })
-
-    def test_full_lifecycle(self):
+    def test_full_lifecycle(self, trace):
         """Test: create session → actions → complete."""
-        trace = self._make_trace()
         session = trace.create_session()
 
         # Action within budget
@@ -245,17 +241,15 @@ class TestAgentTrace:
         assert summary["state"] == "completed"
         assert summary["total_cost_usd"] == 0.10
 
-    def test_budget_kill(self):
+    def test_budget_kill(self, trace):
         """Test: session killed when budget exceeded."""
-        trace = self._make_trace()
         session = trace.create_session()
 
-        # Spend most of the budget
-        for i in range(9):
-            trace.pre_action(session.session_id, f"action_{i}", estimated_cost=0.20)
-            trace.post_action(session.session_id, f"action_{i}", actual_cost=0.20)
-
-        assert session.total_cost == pytest.approx(1.80)
+        # Prime cumulative cost directly (white-box): the decision under
+        # test only depends on total_cost, and the 9 pre/post round-trips
+        # previously here exercised nothing this test asserts.
+        session._total_micro = 1_800_000
+        assert session.total_cost == 1.80  # exact: integer micro-USD
 
         # This should trigger kill (1.80 + 0.30 > 2.00)
         decision = trace.pre_action(session.session_id, "final_action", estimated_cost=0.30)
@@ -263,9 +257,8 @@ class TestAgentTrace:
         assert decision.action_taken == PolicyAction.KILL
         assert not session.is_active
 
-    def test_violation_kill(self):
+    def test_violation_kill(self, trace):
         """Test: session killed after 3 PII violations."""
-        trace = self._make_trace()
         session = trace.create_session()
 
         # First 2 violations — session stays active
@@ -280,30 +273,24 @@ class TestAgentTrace:
         assert not session.is_active
         assert session.state == SessionState.KILLED
 
-    def test_action_after_kill_raises(self):
+    def test_action_after_kill_raises(self, trace):
         """Test: can't take actions on a killed session."""
-        trace = self._make_trace()
         session = trace.create_session()
 
-        # Kill via violations
-        for _ in range(3):
-            trace.record_violation(session.session_id, "pii_blocked")
+        # Kill directly — the violation→kill path is already covered by
+        # test_violation_kill; this test only cares about post-kill state
+        session.kill("pii_blocked x3")
 
         with pytest.raises(SessionKilledError):
             trace.pre_action(session.session_id, "blocked_action", estimated_cost=0.01)
 
-    def test_audit_log_populated(self):
+    def test_audit_log_populated(self, trace):
         """Test: audit log captures all events."""
-        trace = self._make_trace()
         session = trace.create_session()
 
         trace.pre_action(session.session_id, "action_1", estimated_cost=0.10)
         trace.post_action(session.session_id, "action_1", actual_cost=0.10)
         trace.record_violation(session.session_id, "pii_blocked")
 
-        entries = trace.audit.entries_for_session(session.session_id)
-        event_types = [e.event_type for e in entries]
-        
-        assert "session_created" in event_types
-        assert "action_allowed" in event_types
-        assert "violation" in event_types
+        event_types = trace.audit.event_types_for_session(session.session_id)
+        assert {"session_created", "action_allowed", "violation"} <= event_types